@@ -0,0 +1,79 @@
+from manim import *
+import numpy as np
+
+
+def adaptive_samples(sample, t_min, t_max, tolerance, pixels_per_unit, initial_samples=8, max_depth=12):
+    """Samples a curve densely only where it bends.
+
+    sample maps an array of parameters to an (n, 3) array of scene points. An
+    interval is split when its midpoint lies more than tolerance pixels away from
+    its chord, and only the two new halves are checked again, so each level of
+    refinement is one vectorized call covering every interval that still needs it.
+    """
+    t_values = np.linspace(t_min, t_max, initial_samples + 1)
+    points = sample(t_values)
+    active = np.ones(initial_samples, dtype=bool)
+    for _ in range(max_depth):
+        active_index = np.flatnonzero(active)
+        t_mid = (t_values[active_index] + t_values[active_index + 1]) / 2
+        mid_points = sample(t_mid)
+        chord_mid = (points[active_index] + points[active_index + 1]) / 2
+        error = np.linalg.norm(mid_points - chord_mid, axis=1) * pixels_per_unit
+        split = error > tolerance
+        if not split.any():
+            break
+
+        t_values = np.insert(t_values, active_index[split] + 1, t_mid[split])
+        points = np.insert(points, active_index[split] + 1, mid_points[split], axis=0)
+        refined = np.zeros_like(active)
+        refined[active_index[split]] = True
+        # A split interval turns into two active halves, every other interval is settled
+        active = np.repeat(refined, np.where(refined, 2, 1))
+    return t_values, points
+
+
+class AdaptiveParametricFunction(ParametricFunction):
+    """ParametricFunction that places its anchors by screen-space error instead of a fixed step.
+
+    tolerance is measured in pixels at the resolution being rendered. The chord
+    error bounds the error of the smoothed curve, which only gets closer.
+    """
+
+    def __init__(self, function, t_range=(0, 1), tolerance=1.0, initial_samples=8, max_depth=12, **kwargs):
+        self.tolerance = tolerance
+        self.initial_samples = initial_samples
+        self.max_depth = max_depth
+        super().__init__(function, t_range=t_range, **kwargs)
+
+    def sample_points(self, t_values):
+        t_values = self.scaling.function(t_values)
+        if self.use_vectorized:
+            return np.stack(np.broadcast_arrays(*self.function(t_values)), axis=1)
+        return np.array([self.function(t) for t in t_values])
+
+    def generate_points(self):
+        pixels_per_unit = config.pixel_width / config.frame_width
+        _, points = adaptive_samples(
+            self.sample_points, self.t_min, self.t_max, self.tolerance, pixels_per_unit,
+            self.initial_samples, self.max_depth,
+        )
+        self.start_new_path(points[0])
+        self.add_points_as_corners(points[1:])
+        if self.use_smoothing:
+            self.make_smooth()
+        return self
+
+
+def plot_adaptive(axes, function, x_range=None, tolerance=1.0, use_vectorized=True, **kwargs):
+    """Adaptive counterpart of Axes.plot. function must accept arrays when use_vectorized is set."""
+    t_range = axes.x_range[:2] if x_range is None else x_range[:2]
+    graph = AdaptiveParametricFunction(
+        lambda t: axes.coords_to_point(t, function(t)),
+        t_range=t_range,
+        tolerance=tolerance,
+        scaling=axes.x_axis.scaling,
+        use_vectorized=use_vectorized,
+        **kwargs,
+    )
+    graph.underlying_function = function
+    return graph
@@ -0,0 +1,235 @@
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from tempfile import TemporaryDirectory
+
+import manim
+import numpy as np
+from manim import *
+from manim.utils import tex_file_writing
+
+from phaseRender import QUALITIES
+from SimpsonRule import SimpsonRule
+from trapezoidalRule import TrapRule
+
+# Seconds are compared as ratios against the baseline, counts must match exactly
+TIME_METRICS = ("wall_seconds", "construct_seconds", "raster_seconds", "tex_seconds")
+COUNT_METRICS = ("frames", "rasterized_frames", "tex_compiles", "mobjects", "points")
+
+
+class BenchmarkMixin:
+    """Scene mixin that splits the cost of a render by phase.
+
+    Time is recorded from setup onwards and a new record starts when construct
+    begins and at every begin_phase. Each record holds the wall time, the time
+    spent rasterizing frames and compiling LaTeX, and the mobject and point
+    counts on screen when the phase ends. construct_seconds is the wall time
+    left over once rasterizing and LaTeX are taken out. frames counts every
+    frame written and rasterized_frames only those drawn, since holds and
+    frames reused by the frame dedup are written without drawing.
+    """
+
+    def setup(self):
+        self.benchmark_phases = []
+        self._open_benchmark_phase("setup")
+        update_frame = self.timed(self.renderer.update_frame, "raster_seconds")
+
+        def counted_update_frame(*args, **kwargs):
+            # update_frame returns at once while animations are skipped
+            if not self.renderer.skip_animations or kwargs.get("ignore_skipping"):
+                self.benchmark_phases[-1]["rasterized_frames"] += 1
+            return update_frame(*args, **kwargs)
+
+        self.renderer.update_frame = counted_update_frame
+        add_frame = self.renderer.add_frame
+
+        def counted_add_frame(frame, num_frames=1):
+            if not self.renderer.skip_animations:
+                self.benchmark_phases[-1]["frames"] += num_frames
+            add_frame(frame, num_frames)
+
+        self.renderer.add_frame = counted_add_frame
+        super().setup()
+
+    def construct(self):
+        self._open_benchmark_phase("construct")
+        super().construct()
+
+    def begin_phase(self, name, **inputs):
+        self._open_benchmark_phase(name)
+        super().begin_phase(name, **inputs)
+
+    def tear_down(self):
+        super().tear_down()
+        self._close_benchmark_phase()
+
+    def timed(self, function, seconds_key, count_key=None):
+        """Wraps function so its run time, and optionally its call count, go to the current phase."""
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record = self.benchmark_phases[-1]
+                record[seconds_key] += time.perf_counter() - start
+                if count_key is not None:
+                    record[count_key] += 1
+        return wrapper
+
+    def _open_benchmark_phase(self, name):
+        if self.benchmark_phases:
+            self._close_benchmark_phase()
+        record = dict.fromkeys(TIME_METRICS + COUNT_METRICS, 0)
+        record["phase"] = name
+        record["start"] = time.perf_counter()
+        self.benchmark_phases.append(record)
+
+    def _close_benchmark_phase(self):
+        record = self.benchmark_phases[-1]
+        record["wall_seconds"] = time.perf_counter() - record.pop("start")
+        record["construct_seconds"] = record["wall_seconds"] - record["raster_seconds"] - record["tex_seconds"]
+        family = self.get_mobject_family_members()
+        record["mobjects"] = len(family)
+        record["points"] = int(sum(len(mob.points) for mob in family))
+
+
+def trapezoid_benchmark(delta_x):
+    """TrapRule working through delta_x alone, with no closing sweep."""
+    return type("TrapezoidBenchmark", (TrapRule,), {"delta_xs": (delta_x,), "sweep_delta_xs": ()})
+
+
+def simpson_benchmark(n):
+    """SimpsonRule working through n alone, with no worked examples."""
+    return type("SimpsonBenchmark", (SimpsonRule,), {"examples": (), "ns": (n,)})
+
+
+def run_benchmark(scene_class, quality="low_quality", warm_tex=False):
+    """Renders scene_class headless and returns its phase records.
+
+    LaTeX compiles into a fresh directory unless warm_tex is set, so the
+    compile counts do not depend on what earlier renders left in the cache.
+    """
+    with TemporaryDirectory() as tex_dir, tempconfig({
+        "quality": quality,
+        "input_file": sys.modules[scene_class.__module__].__file__,
+        # Turns off every media artifact. tempconfig silently drops keys it does not know, such as write_to_movie
+        "format": "none",
+        "disable_caching": True,
+        "preview": False,
+    }):
+        attributes = {} if warm_tex else {"tex_cache_dir": tex_dir}
+        # LaTeX is timed where the scene asks for it rather than in a precompile pool
+        attributes["precompile_tex"] = False
+        scene = type(scene_class.__name__, (BenchmarkMixin, scene_class), attributes)()
+        originals = {name: getattr(tex_file_writing, name) for name in ("compile_tex", "convert_to_svg")}
+        tex_file_writing.compile_tex = scene.timed(originals["compile_tex"], "tex_seconds", "tex_compiles")
+        tex_file_writing.convert_to_svg = scene.timed(originals["convert_to_svg"], "tex_seconds")
+        try:
+            scene.render()
+        finally:
+            for name, original in originals.items():
+                setattr(tex_file_writing, name, original)
+    return scene.benchmark_phases
+
+
+def summarize(phases, parameters=None):
+    total = {metric: sum(record[metric] for record in phases) for metric in TIME_METRICS + ("frames", "rasterized_frames", "tex_compiles")}
+    # Counts on screen are a snapshot, so the total keeps the largest one
+    total.update({metric: max(record[metric] for record in phases) for metric in ("mobjects", "points")})
+    total["raster_ms_per_frame"] = 1000 * total["raster_seconds"] / max(total["rasterized_frames"], 1)
+    return {"parameters": parameters or {}, "total": total, "phases": phases}
+
+
+def run_suite(delta_xs, ns, quality="low_quality", warm_tex=False, repeat=1, full_scenes=True):
+    """Runs every benchmark repeat times and keeps the fastest run of each."""
+    benchmarks = []
+    if full_scenes:
+        benchmarks += [("TrapRule", TrapRule, {}), ("SimpsonRule", SimpsonRule, {})]
+    a, b = TrapRule.x_range
+    for delta_x in delta_xs:
+        benchmarks.append((f"trapezoids delta_x={delta_x:g}", trapezoid_benchmark(delta_x), {"delta_x": delta_x, "trapezoids": int(np.ceil((b - a) / delta_x))}))
+    for n in ns:
+        benchmarks.append((f"simpson n={n}", simpson_benchmark(n), {"n": n}))
+
+    results = {}
+    for name, scene_class, parameters in benchmarks:
+        runs = [summarize(run_benchmark(scene_class, quality, warm_tex), parameters) for _ in range(repeat)]
+        results[name] = min(runs, key=lambda run: run["total"]["wall_seconds"])
+        logger.info(f"Benchmark {name}: {results[name]['total']['wall_seconds']:.2f}s")
+    return {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "manim": manim.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quality": quality,
+            "warm_tex": warm_tex,
+        },
+        "benchmarks": results,
+    }
+
+
+def format_report(results):
+    header = f"{'benchmark':<28}{'wall s':>9}{'build s':>9}{'raster s':>10}{'ms/frame':>10}{'frames':>8}{'drawn':>7}{'tex':>6}{'tex s':>8}{'mobjects':>10}{'points':>9}"
+    lines = [header, "-" * len(header)]
+    for name, result in results["benchmarks"].items():
+        total = result["total"]
+        lines.append(
+            f"{name:<28}{total['wall_seconds']:>9.2f}{total['construct_seconds']:>9.2f}{total['raster_seconds']:>10.2f}"
+            f"{total['raster_ms_per_frame']:>10.2f}{total['frames']:>8}{total['rasterized_frames']:>7}{total['tex_compiles']:>6}{total['tex_seconds']:>8.2f}"
+            f"{total['mobjects']:>10}{total['points']:>9}"
+        )
+        if len(result["phases"]) > 2:
+            for record in result["phases"]:
+                lines.append(
+                    f"  {record['phase']:<26}{record['wall_seconds']:>9.2f}{record['construct_seconds']:>9.2f}"
+                    f"{record['raster_seconds']:>10.2f}{'':>10}{record['frames']:>8}{record['rasterized_frames']:>7}{record['tex_compiles']:>6}"
+                    f"{record['tex_seconds']:>8.2f}{record['mobjects']:>10}{record['points']:>9}"
+                )
+    return "\n".join(lines)
+
+
+def compare(results, baseline, tolerance=0.1):
+    """Lists the totals that got slower than baseline by more than tolerance, or whose counts changed."""
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        before, after = baseline["benchmarks"][name]["total"], result["total"]
+        for metric in TIME_METRICS:
+            # Ignore differences too small to time reliably
+            if after[metric] > before[metric] * (1 + tolerance) and after[metric] - before[metric] > 0.05:
+                regressions.append(f"{name}: {metric} {before[metric]:.2f} -> {after[metric]:.2f} ({after[metric] / before[metric] - 1:+.0%})")
+        for metric in COUNT_METRICS:
+            # Baselines saved before a count was added have nothing to compare it with
+            if metric in before and after[metric] != before[metric]:
+                regressions.append(f"{name}: {metric} {before[metric]} -> {after[metric]}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the construction and rendering cost of the scenes.")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("--delta-x", type=float, nargs="*", default=[10, 5, 2, 1, 0.5, 0.25], help="trapezoid widths to benchmark")
+    parser.add_argument("--n", type=int, nargs="*", default=[2, 4, 8, 16, 32], help="even numbers of Simpson intervals to benchmark")
+    parser.add_argument("--no-scenes", action="store_true", help="skip the full TrapRule and SimpsonRule renders")
+    parser.add_argument("--warm-tex", action="store_true", help="use the shared tex cache instead of compiling from scratch")
+    parser.add_argument("--repeat", type=int, default=1, help="keep the fastest of this many runs")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check the results against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed slowdown before a time counts as a regression")
+    args = parser.parse_args()
+
+    results = run_suite(args.delta_x, args.n, QUALITIES[args.quality], args.warm_tex, args.repeat, not args.no_scenes)
+    print(format_report(results))
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        print("\n".join(regressions) or "No regressions against " + args.compare)
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,69 @@
+import argparse
+import json
+import sys
+import time
+
+import sympy as sp
+
+from lessonData import SIMPSON_RULE_LESSON, TRAP_RULE_LESSON, simpson_rule_results, trap_rule_results, x_range_defaults
+
+# Scene name -> the function computing its numbers and the lesson it is taught with
+DRY_RUNS = {
+    "TrapRule": (trap_rule_results, TRAP_RULE_LESSON),
+    "SimpsonRule": (simpson_rule_results, SIMPSON_RULE_LESSON),
+}
+
+
+def dry_run(scene, **overrides):
+    """Computes the numbers scene would show, with any lesson parameter overridden.
+
+    f_expr may be given as a string, in terms of x. Nothing here imports Manim
+    or calls LaTeX, so a variant takes milliseconds.
+    """
+    if scene not in DRY_RUNS:
+        raise ValueError(f"No dry run for {scene!r}, expected one of {', '.join(DRY_RUNS)}")
+    compute, lesson = DRY_RUNS[scene]
+    unknown = set(overrides) - set(lesson)
+    if unknown:
+        raise ValueError(f"{scene} has no parameter {', '.join(sorted(unknown))}")
+    parameters = {**lesson, **overrides}
+    if "x_range" in overrides:
+        # The same scaled widths and examples the render farm gives a job with its own x_range
+        for key, value in x_range_defaults(overrides["x_range"]).items():
+            if key in lesson and key not in overrides:
+                parameters[key] = value
+    if isinstance(parameters["f_expr"], str):
+        parameters["f_expr"] = sp.sympify(parameters["f_expr"])
+    return {"scene": scene, "f_expr": str(parameters["f_expr"]), **compute(**parameters)}
+
+
+def dry_run_variants(lines):
+    """Runs one dry run per JSON line and yields its results, or the error it raised."""
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        start = time.perf_counter()
+        try:
+            variant = json.loads(line)
+            result = dry_run(variant.pop("scene"), **variant)
+        except Exception as error:
+            result = {"line": line_number, "error": f"{type(error).__name__}: {error}"}
+        result["milliseconds"] = (time.perf_counter() - start) * 1000
+        yield result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print the numbers the scenes show as JSON, without rendering anything.")
+    parser.add_argument("scenes", nargs="*", default=list(DRY_RUNS), help="scenes to dry run with their lesson parameters")
+    parser.add_argument("--variants", help="JSONL file with one variant per line, e.g. "
+                        '{"scene": "TrapRule", "f_expr": "x**2", "x_range": [0, 4], "delta_xs": [2, 1]}')
+    args = parser.parse_args()
+
+    if args.variants:
+        failed = False
+        with open(args.variants) as file:
+            for result in dry_run_variants(file):
+                failed = failed or "error" in result
+                print(json.dumps(result))
+        sys.exit(1 if failed else 0)
+    print(json.dumps([dry_run(scene) for scene in args.scenes], indent=2))
@@ -0,0 +1,52 @@
+from integration import simpson_sum, simpson_terms
+
+# Terms kept of each elided sum in all, split between its start and end, so the LaTeX and glyph count stay flat as n grows
+DEFAULT_TERM_BUDGET = 6
+
+
+def elide_terms(terms, budget=DEFAULT_TERM_BUDGET):
+    r"""Keeps the first and last terms of a long sum and replaces the middle ones with \cdots."""
+    terms = list(terms)
+    if len(terms) <= budget:
+        return terms
+    head = (budget + 1) // 2
+    tail = budget - head
+    return terms[:head] + [r"\cdots"] + terms[len(terms) - tail:]
+
+
+def join_terms(*groups, budget=DEFAULT_TERM_BUDGET):
+    """Joins groups of terms with +, eliding each group on its own and skipping empty groups."""
+    return " + ".join(term for group in groups for term in elide_terms(group, budget))
+
+
+def simpson_substitution_tex(x_values, y_values, budget=DEFAULT_TERM_BUDGET):
+    """LaTeX for Simpson's rule written out over the samples, followed by the three substitution lines.
+
+    Every sample's x and f(x) fragment is formatted once and shared by the general
+    line and the first substituted line, which elide exactly the same terms.
+    """
+    n = len(x_values) - 1
+    a, b = x_values[0], x_values[-1]
+    h = (b - a) / n
+    x_texts = [f"{x:.2f}" for x in x_values]
+    f_texts = [f"{y:.2f}" for y in y_values]
+    odd, even = range(1, n, 2), range(2, n, 2)
+    integral = rf"\int_{{{x_texts[0]}}}^{{{x_texts[-1]}}} f(x) \, dx \approx \frac{{h}}{{3}}"
+
+    general_sum = join_terms(
+        [f"f({x_texts[0]})"], [f"4f({x_texts[i]})" for i in odd],
+        [f"2f({x_texts[i]})" for i in even], [f"f({x_texts[-1]})"], budget=budget,
+    )
+    substituted_sum = join_terms(
+        [f_texts[0]], [f"4({f_texts[i]})" for i in odd],
+        [f"2({f_texts[i]})" for i in even], [f_texts[-1]], budget=budget,
+    )
+    first_value, odd_sum, even_sum, last_value = simpson_terms(y_values)
+
+    general_expr = rf"{integral} \left[ {general_sum} \right]"
+    substituted_lines = [
+        rf"{integral} \left[ {substituted_sum} \right]",
+        rf"= \frac{{{h:.2f}}}{{3}} \left[ {first_value:.2f} + {odd_sum:.2f} + {even_sum:.2f} + {last_value:.2f} \right]",
+        rf"= {simpson_sum(y_values, a, b):.2f}",
+    ]
+    return general_expr, substituted_lines
@@ -0,0 +1,125 @@
+import hashlib
+from fractions import Fraction
+
+import av
+import numpy as np
+from manim import *
+from manim.mobject.types.image_mobject import AbstractImageMobject
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.scene.video_segment_encoder import VideoSegmentEncoder
+from manim.utils.family import extract_mobject_family_members
+
+
+def mobject_state_digest(mobjects):
+    """Digest of everything the Cairo camera draws for mobjects.
+
+    Returns None when one of them keeps drawing state the digest does not
+    cover, so that frame is always rasterized.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for mob in extract_mobject_family_members(mobjects, only_those_with_points=True):
+        if isinstance(mob, VMobject):
+            arrays = (mob.points, mob.fill_rgbas, mob.stroke_rgbas, mob.background_stroke_rgbas, mob.sheen_direction)
+            style = (mob.stroke_width, mob.background_stroke_width, mob.sheen_factor, mob.joint_type, mob.cap_style, mob.z_index)
+        elif isinstance(mob, ImageMobject):
+            arrays = (mob.points, mob.pixel_array)
+            style = (mob.z_index,)
+        elif isinstance(mob, PMobject):
+            arrays = (mob.points, mob.rgbas)
+            style = (mob.stroke_width, mob.z_index)
+        elif isinstance(mob, AbstractImageMobject):
+            return None
+        else:
+            # The camera draws nothing for any other kind of mobject
+            continue
+        digest.update(id(mob).to_bytes(8, "little"))
+        for array in arrays:
+            digest.update(np.ascontiguousarray(array).data)
+        digest.update(repr(style).encode("utf-8"))
+    return digest.digest()
+
+
+class HeldFrameEncoder(VideoSegmentEncoder):
+    """Segment encoder that converts a run of identical frames only once.
+
+    A run is a frame written with repeat > 1 or the same frame array written
+    again. Every frame of it is still encoded at its own time, so the segment
+    keeps a constant frame rate and concatenates like any other, but the RGBA
+    frame is converted to the stream's pixel format once per run and the
+    codec turns the repeats into nearly empty skip frames.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._held_pixels = None
+        self._held_frame = None
+
+    def write_frame(self, pixels, *, repeat=1):
+        self._validate_frame(pixels, repeat)
+        if pixels is not self._held_pixels:
+            frame = av.VideoFrame.from_ndarray(pixels, format="rgba")
+            self._held_frame = frame.reformat(format=self._stream.pix_fmt)
+            self._held_pixels = pixels
+        time_base = Fraction(self.spec.frame_rate.denominator, self.spec.frame_rate.numerator)
+        try:
+            for _ in range(repeat):
+                # The encoder keeps its own reference, so the frame can be sent again at the next time
+                self._held_frame.pts = self._next_pts
+                self._held_frame.time_base = time_base
+                self._next_pts += 1
+                for packet in self._stream.encode(self._held_frame):
+                    self._container.mux(packet)
+        except BaseException as error:
+            raise self._operation_error("encode", error) from error
+
+
+class HeldFrameFileWriter(SceneFileWriter):
+    def _create_segment_encoder(self, target):
+        if self.video_encoder is None:
+            raise RuntimeError("Video segment encoding requires resolved settings.")
+        return HeldFrameEncoder(target=target, spec=self.video_encoder)
+
+
+class DedupCairoRenderer(CairoRenderer):
+    """CairoRenderer that only rasterizes a frame when something it draws has changed.
+
+    The moving mobjects of each frame are digested before drawing, and when
+    nothing changed since the last frame of the same play the previous frame
+    is sent again, which HeldFrameEncoder encodes without converting it again.
+    """
+
+    def __init__(self, file_writer_class=HeldFrameFileWriter, **kwargs):
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
+        self.last_frame = None
+        self.last_frame_digest = None
+        self.reused_frames = 0
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        # The static background changes between plays, so frames are only reused within one
+        self.last_frame_digest = None
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def render(self, scene, time, moving_mobjects=None):
+        if self.skip_animations or type(self.camera) is not Camera:
+            return super().render(scene, time, moving_mobjects)
+        mobjects = moving_mobjects or list_update(scene.mobjects, scene.foreground_mobjects)
+        digest = mobject_state_digest(mobjects)
+        if digest is None or digest != self.last_frame_digest:
+            self.update_frame(scene, moving_mobjects)
+            self.last_frame = self.get_frame()
+            self.last_frame_digest = digest
+        else:
+            self.reused_frames += 1
+        self.add_frame(self.last_frame)
+
+
+class FrameDedupMixin:
+    """Scene mixin that renders with DedupCairoRenderer, so holds cost one frame to draw and convert."""
+
+    def __init__(self, renderer=None, **kwargs):
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = DedupCairoRenderer(
+                camera_class=kwargs.get("camera_class", Camera),
+                skip_animations=kwargs.get("skip_animations", False),
+            )
+        super().__init__(renderer=renderer, **kwargs)
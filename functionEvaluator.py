@@ -0,0 +1,70 @@
+import numpy as np
+import sympy as sp
+
+from symbolicCache import symbolic_cache
+
+
+class CompiledFunction:
+    """A sympy expression compiled once into a NumPy function of a single variable.
+
+    Calling it with a scalar returns a float, calling it with an array evaluates
+    every sample in one vectorized call. With a SymbolicCache the polynomial
+    coefficients are read from disk instead of worked out by sympy.
+    """
+
+    def __init__(self, f_expr, symbol, cache=None):
+        self.f_expr = f_expr
+        self.symbol = symbol
+        if cache is not None:
+            self._numpy_func = cache.lambdify(f_expr, symbol)
+            self.coefficients = cache.polynomial_coefficients(f_expr, symbol)
+            return
+        self._numpy_func = sp.lambdify(symbol, f_expr, modules="numpy")
+        # Polynomials keep their coefficients for in-place Horner evaluation
+        if sp.sympify(f_expr).is_polynomial(symbol):
+            self.coefficients = [float(c) for c in sp.Poly(f_expr, symbol).all_coeffs()]
+        else:
+            self.coefficients = None
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(self._numpy_func(x), dtype=float)
+        # Constant expressions lambdify to a scalar, so spread them over the input
+        if y.shape != x.shape:
+            y = np.broadcast_to(y, x.shape).copy()
+        return y if y.ndim else float(y)
+
+    def evaluate_into(self, x, out):
+        """Writes f(x) into out. Polynomials are evaluated without allocating any arrays."""
+        if self.coefficients is None:
+            np.copyto(out, self(x))
+            return out
+        out.fill(self.coefficients[0])
+        for coefficient in self.coefficients[1:]:
+            np.multiply(out, x, out=out)
+            np.add(out, coefficient, out=out)
+        return out
+
+
+class FunctionEvaluator:
+    """Compiles each sympy expression once and memoizes the result by expression."""
+
+    def __init__(self, symbol=None, cache=None):
+        self.symbol = symbol if symbol is not None else sp.Symbol('x')
+        self.cache = cache
+        self._compiled = {}
+
+    def compile(self, f_expr):
+        compiled = self._compiled.get(f_expr)
+        if compiled is None:
+            compiled = CompiledFunction(f_expr, self.symbol, self.cache)
+            self._compiled[f_expr] = compiled
+        return compiled
+
+    def evaluate(self, f_expr, x):
+        return self.compile(f_expr)(x)
+
+
+# Shared evaluator so every scene in a process reuses the same compiled functions,
+# and every process the same generated source
+evaluator = FunctionEvaluator(cache=symbolic_cache)
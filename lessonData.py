@@ -0,0 +1,87 @@
+import numpy as np
+import sympy as sp
+
+from functionEvaluator import evaluator
+from integration import composite_trapezoid, percent_error, reference_integral, simpson_sum, simpson_terms
+
+x = sp.Symbol('x')
+
+# The function and intervals each lesson is taught with
+TRAP_RULE_LESSON = {
+    "f_expr": 0.05 * x**3 - 0.55 * x**2 + x + 7,
+    "x_range": (0, 10),
+    "delta_xs": (10, 5),
+}
+SIMPSON_RULE_LESSON = {
+    "f_expr": sp.exp(x / 2) - x**3 + 100 * x,
+    "x_range": (0, 10),
+    "examples": ((1, 2, 3), (0, 5, 10)),
+    "ns": (4, 8),
+}
+
+
+def _tidy(value):
+    # Rounded so derived values label as 0.9 rather than 0.8999999999999999, and whole ones as ints
+    value = round(float(value), 10)
+    return int(value) if value.is_integer() else value
+
+
+def x_range_defaults(x_range):
+    """The lessons' widths and example points scaled from their x_range of (0, 10) to x_range.
+
+    The lessons' own values only fit their own x_range, so a lesson taught
+    over another range takes these for any it does not set.
+    """
+    a, b = x_range
+    width = b - a
+    return {
+        "delta_xs": (_tidy(width), _tidy(width / 2)),
+        "sweep_delta_xs": tuple(_tidy(width / parts) for parts in (5, 10, 20)),
+        "examples": (tuple(_tidy(a + width * tenths / 10) for tenths in (1, 2, 3)), (_tidy(a), _tidy((a + b) / 2), _tidy(b))),
+    }
+
+
+def trap_rule_results(f_expr, x_range=(0, 10), delta_xs=(10, 5)):
+    """Every number TrapRule shows, computed without building a single mobject."""
+    func = evaluator.compile(f_expr)
+    a, b = x_range
+    integral_value = reference_integral(func, a, b)
+    # A percentage of an integral that cancels out is undefined, so only the absolute error is given then
+    zero_integral = np.isclose(integral_value, 0, atol=1e-9 * reference_integral(lambda t: np.abs(func(t)), a, b))
+    results = {"integral_value": integral_value}
+    for delta_x in delta_xs:
+        n = int(round((b - a) / delta_x))
+        if n < 1 or not np.isclose(n * delta_x, b - a):
+            raise ValueError(f"delta_x = {delta_x} does not split [{a}, {b}] into whole panels")
+        trap_area = composite_trapezoid(func, a, b, n)
+        results[f"trap_area_{delta_x:g}"] = float(trap_area)
+        results[f"absolute_error_{delta_x:g}"] = float(trap_area - integral_value)
+        results[f"percent_error_{delta_x:g}"] = None if zero_integral else float(percent_error(trap_area, integral_value))
+    return results
+
+
+def simpson_panel_results(func, x_values):
+    """Samples, bracketed sums and estimate of Simpson's rule over x_values."""
+    x_array = np.asarray(x_values, dtype=float)
+    y_values = func(x_array)
+    first_value, odd_sum, even_sum, last_value = simpson_terms(y_values)
+    return {
+        "x_values": x_array.tolist(),
+        "y_values": y_values.tolist(),
+        "first_value": float(first_value),
+        "odd_sum": float(odd_sum),
+        "even_sum": float(even_sum),
+        "last_value": float(last_value),
+        "area": float(simpson_sum(y_values, x_array[0], x_array[-1])),
+    }
+
+
+def simpson_rule_results(f_expr, x_range=(0, 10), examples=((1, 2, 3), (0, 5, 10)), ns=(4, 8)):
+    """Every number SimpsonRule shows, for its worked examples and each n, without Manim."""
+    func = evaluator.compile(f_expr)
+    a, b = x_range
+    return {
+        "reference_integral": reference_integral(func, a, b),
+        "examples": [simpson_panel_results(func, points) for points in examples],
+        "n": {str(n): simpson_panel_results(func, np.linspace(a, b, n + 1)) for n in ns},
+    }
@@ -0,0 +1,45 @@
+from manim import *
+import numpy as np
+
+
+class MobjectPool:
+    """Named slots for the geometry that takes on a new role in every phase.
+
+    The first request for a slot creates its mobject. Later requests reshape
+    that same mobject instead of handing out a new one: a line is moved, and a
+    point set is overwritten in place when it keeps its size and only resized
+    when it does not. Text is not pooled, since the glyphs of a new string only
+    come from parsing its SVG into a new MathTex, so labels are built as usual.
+
+    A slot holds one role at a time, so it should leave the screen before it is
+    asked for again.
+    """
+
+    def __init__(self):
+        self.slots = {}
+
+    def __getitem__(self, name):
+        return self.slots[name]
+
+    def line(self, name, start, end, **kwargs):
+        line = self.slots.get(name)
+        if line is None:
+            line = self.slots[name] = Line(start, end, **kwargs)
+        else:
+            line.put_start_and_end_on(start, end)
+        return line
+
+    def points(self, name, points, **kwargs):
+        """VMobject slot whose points are replaced by points, keeping the style of its first use."""
+        vmobject = self.slots.get(name)
+        if vmobject is None:
+            vmobject = self.slots[name] = VMobject(**kwargs)
+        self._copy_points(vmobject, points)
+        return vmobject
+
+    @staticmethod
+    def _copy_points(mobject, points):
+        if mobject.points.shape == points.shape:
+            np.copyto(mobject.points, points)
+        else:
+            mobject.set_points(points)
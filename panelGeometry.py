@@ -0,0 +1,189 @@
+from manim import *
+import numpy as np
+
+# Positions of the four control points of a straight cubic Bezier segment
+LINE_BEZIER_STEPS = np.array([0, 1 / 3, 2 / 3, 1])
+
+
+def axes_to_points(axes, x_coords, y_coords):
+    """Maps arrays of graph coordinates to scene points with one array operation.
+
+    The axes are linear, so c2p is an affine map that is fully described by the
+    origin and the two unit vectors.
+    """
+    origin = np.asarray(axes.c2p(0, 0), dtype=float)
+    x_unit = np.asarray(axes.c2p(1, 0), dtype=float) - origin
+    y_unit = np.asarray(axes.c2p(0, 1), dtype=float) - origin
+    return origin + np.multiply.outer(x_coords, x_unit) + np.multiply.outer(y_coords, y_unit)
+
+
+def polygons_to_bezier_points(corners):
+    """Turns closed polygons of shape (panels, corners, 3) into VMobject points.
+
+    Every edge becomes a straight cubic Bezier segment, the same way
+    Polygon.set_points_as_corners does it, and every polygon becomes its own subpath.
+    """
+    edge_ends = np.roll(corners, -1, axis=-2)
+    steps = LINE_BEZIER_STEPS[:, np.newaxis]
+    points = corners[..., np.newaxis, :] + steps * (edge_ends - corners)[..., np.newaxis, :]
+    return points.reshape(-1, 3)
+
+
+def trapezoid_corners(axes, func, x_start, x_end, delta_x):
+    # One panel per grid step, exactly like np.arange(x_start, x_end, delta_x) in the scene.
+    # Integer ranges must still give a float grid, or the y values written below are truncated
+    x_left = np.arange(x_start, x_end, delta_x, dtype=float)
+    x_right = x_left + delta_x
+    # Neighbouring panels share their nodes, so func sees every node only once
+    y_nodes = func(np.append(x_left, x_right[-1:]))
+
+    x_coords = np.stack([x_left, x_left, x_right, x_right], axis=1)
+    y_coords = np.zeros_like(x_coords)
+    y_coords[:, 1] = y_nodes[:-1]
+    y_coords[:, 2] = y_nodes[1:]
+    return axes_to_points(axes, x_coords, y_coords)
+
+
+def trapezoid_points(axes, func, x_start, x_end, delta_x):
+    return polygons_to_bezier_points(trapezoid_corners(axes, func, x_start, x_end, delta_x))
+
+
+class TrapezoidSweep:
+    """Trapezoid panels for a delta_x that changes every frame, rewritten in place.
+
+    Buffers for as many panels as min_delta_x needs are allocated once, and
+    update fills them with out= operations, so a frame allocates no arrays when
+    func has an evaluate_into that does not either. The last panel is cut at
+    x_end, and the panels beyond the current count collapse onto the vertical
+    edge at x_end, where they have no area and their outline is already drawn.
+    """
+
+    def __init__(self, axes, func, x_start, x_end, min_delta_x, fill_color=BLUE, fill_opacity=0.5, stroke_color=WHITE, **kwargs):
+        self.func = func
+        self.x_start = x_start
+        self.x_end = x_end
+        self.capacity = int(np.ceil((x_end - x_start) / min_delta_x))
+        origin = np.asarray(axes.c2p(0, 0), dtype=float)
+        self.origin = [float(value) for value in origin]
+        self.x_unit = [float(value) for value in np.asarray(axes.c2p(1, 0), dtype=float) - origin]
+        self.y_unit = [float(value) for value in np.asarray(axes.c2p(0, 1), dtype=float) - origin]
+
+        # Each Bezier point of a panel mixes its two nodes with fixed weights, found by
+        # running unit corners through the same conversion the static panels use
+        def bezier_weights(corner_values):
+            corners = np.zeros((1, 4, 3))
+            corners[0, :, 0] = corner_values
+            return polygons_to_bezier_points(corners)[:, 0]
+
+        self.right_x_weights = bezier_weights([0, 0, 1, 1])
+        self.left_y_weights = bezier_weights([0, 1, 0, 0])
+        self.right_y_weights = bezier_weights([0, 0, 1, 0])
+
+        self.node_index = np.arange(self.capacity + 1, dtype=float)
+        self.x_nodes = np.empty(self.capacity + 1)
+        self.y_nodes = np.empty(self.capacity + 1)
+        self.widths = np.empty(self.capacity)
+        self.heights = np.empty(self.capacity)
+        self.x_coords = np.empty((self.capacity, len(self.right_x_weights)))
+        self.y_coords = np.empty_like(self.x_coords)
+        self.scratch = np.empty_like(self.x_coords)
+        self.points = np.empty(self.x_coords.shape + (3,))
+        self.flat_points = self.points.reshape(-1, 3)
+
+        # Views are taken once, since even a view is a new object
+        self.x_left_nodes, self.x_right_nodes = self.x_nodes[:-1], self.x_nodes[1:]
+        self.y_left_nodes, self.y_right_nodes = self.y_nodes[:-1], self.y_nodes[1:]
+        self.x_left = self.x_left_nodes[:, np.newaxis]
+        self.y_left, self.y_right = self.y_left_nodes[:, np.newaxis], self.y_right_nodes[:, np.newaxis]
+        self.width_column = self.widths[:, np.newaxis]
+        self.point_components = [self.points[..., axis] for axis in range(3)]
+        self.evaluate_into = getattr(func, "evaluate_into", None)
+
+        self.panels = VMobject(fill_color=fill_color, fill_opacity=fill_opacity, stroke_color=stroke_color, **kwargs)
+        self.panels.points = self.flat_points
+
+    def update(self, delta_x):
+        np.multiply(self.node_index, delta_x, out=self.x_nodes)
+        np.add(self.x_nodes, self.x_start, out=self.x_nodes)
+        np.minimum(self.x_nodes, self.x_end, out=self.x_nodes)
+        if self.evaluate_into is not None:
+            self.evaluate_into(self.x_nodes, self.y_nodes)
+        else:
+            self.y_nodes[:] = self.func(self.x_nodes)
+
+        np.subtract(self.x_right_nodes, self.x_left_nodes, out=self.widths)
+        np.multiply(self.width_column, self.right_x_weights, out=self.x_coords)
+        np.add(self.x_coords, self.x_left, out=self.x_coords)
+        np.multiply(self.y_left, self.left_y_weights, out=self.y_coords)
+        np.multiply(self.y_right, self.right_y_weights, out=self.scratch)
+        np.add(self.y_coords, self.scratch, out=self.y_coords)
+
+        for component, origin, x_unit, y_unit in zip(self.point_components, self.origin, self.x_unit, self.y_unit):
+            np.multiply(self.x_coords, x_unit, out=component)
+            np.multiply(self.y_coords, y_unit, out=self.scratch)
+            np.add(component, self.scratch, out=component)
+            np.add(component, origin, out=component)
+        # Animations may have swapped the points array out, so put the buffer back
+        self.panels.points = self.flat_points
+        return self.panels
+
+    def area(self):
+        """Trapezoidal rule estimate for the current panels. Collapsed panels have no width."""
+        np.add(self.y_left_nodes, self.y_right_nodes, out=self.heights)
+        return float(np.dot(self.widths, self.heights)) / 2
+
+
+def parabola_coefficients(x_values, y_values):
+    """Coefficients of p(x) = a(x - x1)^2 + b(x - x1) + c for every pair of intervals at once."""
+    x0, x1 = x_values[0:-2:2], x_values[1:-1:2]
+    y0, y1, y2 = y_values[0:-2:2], y_values[1:-1:2], y_values[2::2]
+    h = x1 - x0
+    c = y1
+    a = (y0 + y2 - 2 * y1) / (2 * h ** 2)
+    b = ((y0 + y2 - 2 * y1) / 2 - y0 + y1) / h
+    return a, b, c
+
+
+def parabola_bezier_points(axes, x_values, y_values, overhang=0):
+    """Exact cubic Bezier control points for every Simpson parabola.
+
+    A parabola is a cubic Bezier curve with its handles a third of the way along
+    the end tangents, so each panel needs only its two end points and slopes.
+    The axes are affine, which keeps the curves exact in scene space.
+    """
+    a, b, c = parabola_coefficients(x_values, y_values)
+    x1 = x_values[1:-1:2]
+    u_start = x_values[0:-2:2] - overhang
+    u_end = x_values[2::2] + overhang
+    third = (u_end - u_start) / 3
+
+    def value(u):
+        return a * (u - x1) ** 2 + b * (u - x1) + c
+
+    def slope(u):
+        return 2 * a * (u - x1) + b
+
+    x_coords = np.stack([u_start, u_start + third, u_end - third, u_end], axis=1)
+    y_coords = np.stack([
+        value(u_start),
+        value(u_start) + third * slope(u_start),
+        value(u_end) - third * slope(u_end),
+        value(u_end),
+    ], axis=1)
+    return axes_to_points(axes, x_coords, y_coords).reshape(-1, 3)
+
+
+def sample_dot_points(centers):
+    """Points of a Dot at each center, as the subpaths of one VMobject."""
+    # Every dot is a translated copy of one template circle
+    template = Dot()
+    circle_points = template.points - template.get_center()
+    return (circle_points[np.newaxis] + centers[:, np.newaxis]).reshape(-1, 3)
+
+
+def sample_point_labels(x_values, y_values, centers):
+    # Labels keep the x values exactly as given, so integer samples print without decimals
+    return VGroup(*[
+        MathTex(f"({x}, {y:.2f})").scale(0.5).next_to(center + UP * DEFAULT_DOT_RADIUS, UP)
+        for x, y, center in zip(x_values, y_values, centers)
+    ])
@@ -0,0 +1,264 @@
+import argparse
+import ast
+import hashlib
+import importlib
+import json
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+import av
+import manim
+import numpy as np
+import sympy as sp
+from manim import *
+from manim.utils.caching import prune_segment_cache
+from manim.utils.exceptions import EndSceneEarlyException
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+class PhasedSceneMixin:
+    """Scene mixin that splits construct into named phases that can render on their own.
+
+    A scene lists its phases in order and calls begin_phase at each boundary.
+    The state a phase starts from is whatever the earlier phases leave on
+    screen, so rendering a single phase runs the earlier ones with animations
+    skipped: that builds exactly the same mobjects without drawing a frame, and
+    the phase's partial movies match those of a serial render.
+
+    The keyword inputs given to begin_phase are the values that drive the
+    phase, including the ones its starting state is built from. A phase render
+    is served from the phase cache when a movie for the same inputs, rendered
+    by the same scene and helper source code, exists.
+
+    start_phase works the same way for previews: the earlier phases are
+    skipped and the scene plays on from that phase to its end.
+
+    A scene whose phases follow its parameters, such as one phase per n,
+    returns them from lesson_phases, and every subclass that overrides those
+    parameters gets its phases derived again.
+    """
+
+    phases = ()
+    render_phase = None
+    start_phase = None
+    use_phase_cache = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        phases = cls.lesson_phases()
+        if phases is not None:
+            cls.phases = tuple(phases)
+
+    @classmethod
+    def lesson_phases(cls):
+        return None
+
+    def setup(self):
+        super().setup()
+        self.current_phase = None
+        self.phase_keys = {}
+        self.cached_phase_movie = None
+        self.code_fingerprint = code_fingerprint(type(self))
+        for phase in (self.render_phase, self.start_phase):
+            if phase is not None and phase not in self.phases:
+                raise ValueError(f"{type(self).__name__} has no phase named {phase!r}")
+        if self.render_phase is not None or self.start_phase is not None:
+            self.renderer._original_skipping_status = True
+
+    def begin_phase(self, name, **inputs):
+        if name not in self.phases:
+            raise ValueError(f"Phase {name!r} is not listed in {type(self).__name__}.phases")
+        previous_phase, self.current_phase = self.current_phase, name
+        self.phase_keys[name] = phase_key(type(self).__name__, name, inputs, self.code_fingerprint)
+        if name == self.start_phase:
+            self.renderer._original_skipping_status = False
+        if self.render_phase is None:
+            return
+        if name == self.render_phase:
+            cached_movie = find_cached_phase_movie(self.phase_keys[name]) if self.use_phase_cache else None
+            if cached_movie is not None:
+                self.cached_phase_movie = cached_movie
+                raise EndSceneEarlyException()
+            self.renderer._original_skipping_status = False
+        elif previous_phase == self.render_phase:
+            # Everything after the requested phase belongs to other workers
+            raise EndSceneEarlyException()
+
+
+def _canonical(value):
+    # Reduce phase inputs to plain JSON so equal inputs always hash the same way
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, sp.Basic):
+        return sp.srepr(value)
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return repr(value)
+
+
+def code_fingerprint(scene_class):
+    """Hash of the source a scene renders with.
+
+    That is the module of each of its classes outside Manim, and every module
+    next to one of those that it imports, directly or through another.
+    """
+    pending = []
+    for cls in scene_class.__mro__:
+        module_file = getattr(sys.modules.get(cls.__module__), "__file__", None)
+        if module_file is not None and cls.__module__.partition(".")[0] != "manim":
+            pending.append(Path(module_file).resolve())
+    sources = {}
+    while pending:
+        path = pending.pop()
+        if path in sources:
+            continue
+        sources[path] = path.read_bytes()
+        for node in ast.walk(ast.parse(sources[path])):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                helper = path.parent / (name.partition(".")[0] + ".py")
+                if helper.is_file():
+                    pending.append(helper)
+    digest = hashlib.sha256()
+    # Named by file rather than full path, so checkouts in different places share their keys
+    for path in sorted(sources, key=lambda path: path.name):
+        digest.update(path.name.encode("utf-8") + b"\0" + hashlib.sha256(sources[path]).digest())
+    return digest.hexdigest()
+
+
+def phase_key(scene_name, phase, inputs, code=None):
+    """Hash of everything a phase's frames depend on: its inputs, its code and the output format."""
+    key_data = {
+        "scene": scene_name,
+        "phase": phase,
+        "inputs": _canonical(inputs),
+        "code": code,
+        "manim": manim.__version__,
+        "pixels": [config.pixel_width, config.pixel_height],
+        "frame_rate": config.frame_rate,
+        "background": str(config.background_color),
+        "format": getattr(config, "format", None),
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()[:32]
+
+
+def phase_cache_directory():
+    return Path(config.media_dir) / "phase_cache"
+
+
+def find_cached_phase_movie(key):
+    for cached_movie in phase_cache_directory().glob(f"{key}.*"):
+        if cached_movie.suffix != ".tmp":
+            return cached_movie
+    return None
+
+
+def store_phase_movie(movie_file, key):
+    cached_movie = phase_cache_directory() / (key + Path(movie_file).suffix)
+    cached_movie.parent.mkdir(parents=True, exist_ok=True)
+    # Copy then rename, so other workers never pick up a half-written movie
+    temporary = cached_movie.with_suffix(f".{os.getpid()}.tmp")
+    shutil.copyfile(movie_file, temporary)
+    os.replace(temporary, cached_movie)
+    return cached_movie
+
+
+def phase_output_name(scene_name, phase):
+    return f"{scene_name}_{re.sub(r'[^0-9A-Za-z]+', '_', phase).strip('_')}"
+
+
+def render_single_phase(module_name, scene_name, phase, quality, use_cache=True):
+    """Renders one phase of a scene, or reuses its cached movie, and returns the movie path."""
+    module = importlib.import_module(module_name)
+    # Keep the scene name so the phase shares its partial movie directory with serial renders
+    phase_scene = type(scene_name, (getattr(module, scene_name),), {"render_phase": phase, "use_phase_cache": use_cache})
+    with tempconfig({
+        "quality": quality,
+        "input_file": module.__file__,
+        "output_file": phase_output_name(scene_name, phase),
+        "preview": False,
+        # A worker pruning the shared directory could delete segments another has not joined yet,
+        # so render_phases_in_parallel prunes it once every phase is done
+        "max_files_cached": -1,
+    }):
+        scene = phase_scene()
+        scene.render()
+        if scene.cached_phase_movie is not None:
+            logger.info(f"Phase {phase!r} of {scene_name} is unchanged, reusing {scene.cached_phase_movie}")
+            return str(scene.cached_phase_movie)
+        return str(store_phase_movie(scene.renderer.file_writer.movie_file_path, scene.phase_keys[phase]))
+
+
+def concat_movies(movie_files, output_file):
+    """Joins movies by copying their packets, the same lossless way Manim joins partial movies."""
+    manifest = BytesIO("".join(f"file 'file:{Path(movie_file).as_posix()}'\n" for movie_file in movie_files).encode("utf-8"))
+    movies_input = av.open(manifest, options={"safe": "0", "an": "1"}, format="concat")
+    input_stream = movies_input.streams.video[0]
+    output_container = av.open(str(output_file), mode="w")
+    output_stream = output_container.add_stream_from_template(template=input_stream)
+    for packet in movies_input.demux(input_stream):
+        # Skip the flushing packets and let libav recompute dts across file boundaries
+        if packet.dts is None:
+            continue
+        packet.dts = None
+        packet.stream = output_stream
+        output_container.mux(packet)
+    movies_input.close()
+    output_container.close()
+    manifest.close()
+    return output_file
+
+
+def render_phases_in_parallel(module_name, scene_name, quality="low_quality", workers=None, use_cache=True):
+    phases = getattr(importlib.import_module(module_name), scene_name).phases
+    if not phases:
+        raise ValueError(f"{scene_name} does not declare any phases")
+    workers = workers or min(len(phases), os.cpu_count() or 1)
+
+    # Spawned workers start from a clean Manim config instead of a copy of ours
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        futures = [pool.submit(render_single_phase, module_name, scene_name, phase, quality, use_cache) for phase in phases]
+        movie_files = [future.result() for future in futures]
+
+    with tempconfig({"quality": quality}):
+        output_file = config.get_dir("video_dir", module_name=module_name) / (scene_name + Path(movie_files[0]).suffix)
+        partial_movie_directory = config.get_dir("partial_movie_dir", module_name=module_name, scene_name=scene_name)
+    prune_segment_cache(Path(partial_movie_directory), config.max_files_cached)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    concat_movies(movie_files, output_file)
+    logger.info(f"Rendered {len(phases)} phases of {scene_name} into {output_file}")
+    return output_file
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the phases of a scene in parallel and join them into one movie.")
+    parser.add_argument("module", help="module that defines the scene, e.g. trapezoidalRule")
+    parser.add_argument("scene", help="scene class name, e.g. TrapRule")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="re-render every phase instead of reusing cached phase movies")
+    args = parser.parse_args()
+    render_phases_in_parallel(args.module.removesuffix(".py"), args.scene, QUALITIES[args.quality], args.workers, not args.force)
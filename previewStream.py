@@ -0,0 +1,302 @@
+import argparse
+import importlib
+import shutil
+import subprocess
+import threading
+import webbrowser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from time import perf_counter, sleep
+
+import numpy as np
+from manim import *
+from PIL import Image
+
+from frameDedup import DedupCairoRenderer
+from phaseRender import QUALITIES
+
+
+class LatestFrame:
+    """Hands the newest frame to viewers that may be slower than the renderer.
+
+    A viewer that falls behind skips straight to the newest frame, so the
+    render loop never waits for it. Each frame is JPEG encoded at most once,
+    on the viewer's thread, however many viewers read it.
+    """
+
+    def __init__(self, jpeg_quality=80):
+        self.jpeg_quality = jpeg_quality
+        self.closed = False
+        self._condition = threading.Condition()
+        self._frame = None
+        self._index = 0
+        self._jpeg_index = 0
+        self._jpeg = None
+
+    def publish(self, frame):
+        with self._condition:
+            self._frame, self._index = frame, self._index + 1
+            self._condition.notify_all()
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def next_jpeg(self, seen_index):
+        """Waits for a frame newer than seen_index and returns (index, JPEG bytes), or None once closed."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._index > seen_index or self.closed)
+            if self._index <= seen_index:
+                return None
+            index, frame = self._index, self._frame
+            if self._jpeg_index == index:
+                return index, self._jpeg
+        buffer = BytesIO()
+        Image.fromarray(np.ascontiguousarray(frame[..., :3])).save(buffer, "JPEG", quality=self.jpeg_quality)
+        jpeg = buffer.getvalue()
+        with self._condition:
+            if index > self._jpeg_index:
+                self._jpeg_index, self._jpeg = index, jpeg
+        return index, jpeg
+
+
+class _MJPEGHandler(BaseHTTPRequestHandler):
+    PAGE = (b"<!DOCTYPE html><title>Manim preview</title><body style='margin:0;background:#000'>"
+            b"<img src='/stream' style='width:100vw;height:100vh;object-fit:contain'></body>")
+
+    def do_GET(self):
+        viewer = self.server.viewer
+        if self.path == "/":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(self.PAGE)))
+            self.end_headers()
+            self.wfile.write(self.PAGE)
+        elif self.path == "/stream":
+            self.send_response(200)
+            self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=frame")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            viewer.connected.set()
+            index = 0
+            while (item := viewer.next_jpeg(index)) is not None:
+                index, jpeg = item
+                try:
+                    self.wfile.write(b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n%s\r\n" % (len(jpeg), jpeg))
+                except (BrokenPipeError, ConnectionResetError):
+                    return
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MJPEGViewer(LatestFrame):
+    """Serves the frames as an MJPEG stream on localhost, which any browser plays."""
+
+    def __init__(self, port=8000, open_browser=True, **kwargs):
+        super().__init__(**kwargs)
+        self.open_browser = open_browser
+        self.connected = threading.Event()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), _MJPEGHandler)
+        self.server.daemon_threads = True
+        self.server.viewer = self
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        logger.info(f"Streaming preview at {self.url}")
+        if self.open_browser:
+            webbrowser.open(self.url)
+        return self
+
+    def close(self):
+        super().close()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class FFplayViewer(LatestFrame):
+    """Pipes the frames as MJPEG into an ffplay window with its buffering turned off."""
+
+    def __init__(self, title="Manim preview", **kwargs):
+        super().__init__(**kwargs)
+        if shutil.which("ffplay") is None:
+            raise RuntimeError("ffplay was not found on PATH, use the browser viewer instead")
+        self.command = [
+            "ffplay", "-loglevel", "error", "-window_title", title,
+            "-fflags", "nobuffer", "-flags", "low_delay", "-probesize", "32", "-analyzeduration", "0",
+            "-framedrop", "-f", "mjpeg", "-",
+        ]
+        self.process = None
+        self._writer = None
+        self.connected = threading.Event()
+
+    def start(self):
+        self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE)
+        self._writer = threading.Thread(target=self._write_frames, daemon=True)
+        self._writer.start()
+        self.connected.set()
+        return self
+
+    def _write_frames(self):
+        index = 0
+        while (item := self.next_jpeg(index)) is not None:
+            index, jpeg = item
+            try:
+                self.process.stdin.write(jpeg)
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError):
+                return
+
+    def close(self):
+        super().close()
+        self._writer.join()
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        # ffplay keeps showing the last frame until its window is closed
+        self.process.wait()
+
+
+class StreamingRenderer(DedupCairoRenderer):
+    """Renderer that publishes each frame to a viewer at real-time pace instead of writing a movie.
+
+    Frames are held back to the scene clock when drawing is faster than real
+    time, and dropped without being drawn when it has fallen more than a frame
+    behind. Between play calls the resolution follows the cost of the last
+    play's frames: drawing cost grows with the pixel count, so the scale moves
+    with the square root of the load, between min_scale and full resolution.
+    """
+
+    def __init__(self, viewer, min_scale=0.25, **kwargs):
+        super().__init__(**kwargs)
+        self.viewer = viewer
+        self.min_scale = min_scale
+        self.scale = 1.0
+        self.full_resolution = None
+        self.stream_start = None
+        self.frame_seconds = []
+        self.skipped_frames = 0
+        self.first_frame_time = None
+        self._frame_started = None
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        if not self.skip_animations:
+            self._adapt_resolution()
+            # Building the next play's mobjects takes wall time that is not scene time, so the clock restarts here
+            self.stream_start = None
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def render(self, scene, time, moving_mobjects=None):
+        dt = 1 / self.camera.frame_rate
+        if not self.skip_animations and self.stream_start is not None and perf_counter() - self.stream_start > self.time + dt:
+            self.time += dt
+            self.skipped_frames += 1
+            return
+        self._frame_started = perf_counter()
+        super().render(scene, time, moving_mobjects)
+
+    def add_frame(self, frame, num_frames=1):
+        if self.skip_animations:
+            return
+        now = perf_counter()
+        if self._frame_started is not None:
+            self.frame_seconds.append(now - self._frame_started)
+            self._frame_started = None
+        if self.stream_start is None:
+            self.stream_start = now - self.time
+        if self.first_frame_time is None:
+            self.first_frame_time = now
+        self.viewer.publish(frame)
+        self.time += num_frames / self.camera.frame_rate
+        # Hold the frame on screen until the scene clock catches up with it
+        delay = self.stream_start + self.time - perf_counter()
+        if delay > 0:
+            sleep(delay)
+
+    def _adapt_resolution(self):
+        if self.full_resolution is None:
+            self.full_resolution = (self.camera.pixel_height, self.camera.pixel_width)
+        if not self.frame_seconds:
+            return
+        load = max(float(np.mean(self.frame_seconds)) * self.camera.frame_rate, 1e-3)
+        self.frame_seconds = []
+        scale = float(np.clip(self.scale * 0.9 / np.sqrt(load), self.min_scale, 1.0))
+        if abs(scale - self.scale) < 0.1 * self.scale:
+            return
+        self.scale = scale
+        height, width = self.full_resolution
+        self.camera.reset_pixel_shape(2 * round(height * scale / 2), 2 * round(width * scale / 2))
+        logger.info(f"Preview resolution {self.camera.pixel_width}x{self.camera.pixel_height} (load {load:.2f})")
+
+
+class StreamingPreviewMixin:
+    """Scene mixin that renders with StreamingRenderer into the given viewer."""
+
+    def __init__(self, viewer=None, renderer=None, min_scale=0.25, **kwargs):
+        if renderer is None:
+            renderer = StreamingRenderer(
+                viewer,
+                min_scale=min_scale,
+                camera_class=kwargs.get("camera_class", Camera),
+                skip_animations=kwargs.get("skip_animations", False),
+            )
+        super().__init__(renderer=renderer, **kwargs)
+
+
+def preview(module_name, scene_name, phase=None, quality="low_quality", viewer="browser", port=8000, min_scale=0.25, viewer_timeout=10):
+    """Streams a scene to a viewer as it renders, from phase onwards when one is given.
+
+    The render waits up to viewer_timeout seconds for a viewer to connect, then
+    starts anyway, and viewers that connect later join at the current frame.
+    """
+    module = importlib.import_module(module_name)
+    scene_class = getattr(module, scene_name)
+    if phase is not None and phase not in getattr(scene_class, "phases", ()):
+        raise ValueError(f"{scene_name} has no phase named {phase!r}")
+    preview_scene = type(scene_name, (StreamingPreviewMixin, scene_class), {"start_phase": phase})
+    frame_viewer = MJPEGViewer(port) if viewer == "browser" else FFplayViewer(title=f"{scene_name} preview")
+    frame_viewer.start()
+    # Frames streamed before anyone watches would be lost, so the render waits a while for the viewer
+    if not frame_viewer.connected.is_set():
+        logger.info(f"Waiting up to {viewer_timeout:g}s for a viewer to connect")
+        if not frame_viewer.connected.wait(viewer_timeout):
+            logger.warning("No viewer connected, rendering anyway")
+    with tempconfig({
+        "quality": quality,
+        "input_file": module.__file__,
+        "format": "none",
+        "disable_caching": True,
+        "preview": False,
+    }):
+        start = perf_counter()
+        try:
+            scene = preview_scene(viewer=frame_viewer, min_scale=min_scale)
+            scene.render()
+        finally:
+            frame_viewer.close()
+    renderer = scene.renderer
+    if renderer.first_frame_time is not None:
+        logger.info(
+            f"First frame after {renderer.first_frame_time - start:.2f}s, "
+            f"{renderer.skipped_frames} frames dropped to keep up with real time"
+        )
+    return scene
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream a scene to a browser or ffplay while it renders, without writing a movie.")
+    parser.add_argument("module", help="module that defines the scene, e.g. SimpsonRule")
+    parser.add_argument("scene", help="scene class name, e.g. SimpsonRule")
+    parser.add_argument("--phase", help='phase to start from, e.g. "n = 8"')
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("--viewer", choices=("browser", "ffplay"), default="browser")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--min-scale", type=float, default=0.25, help="smallest fraction of the resolution to downscale to when behind")
+    parser.add_argument("--viewer-timeout", type=float, default=10, help="seconds to wait for a viewer before rendering anyway")
+    args = parser.parse_args()
+    preview(args.module.removesuffix(".py"), args.scene, args.phase, QUALITIES[args.quality], args.viewer, args.port, args.min_scale, args.viewer_timeout)
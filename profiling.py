@@ -0,0 +1,141 @@
+import json
+import linecache
+import os
+import sys
+import time
+from pathlib import Path
+
+from manim import *
+
+from phaseRender import phase_output_name
+
+# Parts of a play call that are timed on their own, by the method that does the work
+PROFILED_PARTS = {
+    "compile_animation_data": "setup",
+    "begin_animations": "setup",
+    "update_to_time": "interpolate",
+    "update_frame": "rasterize",
+    "add_frame": "write",
+}
+
+
+class ProfilingMixin:
+    """Scene mixin that records every play and wait call as a Chrome trace.
+
+    Profiling is off unless profile_trace_dir or the MANIM_PROFILE_TRACE
+    environment variable names a directory. Each call becomes one event named
+    after the source line that issued it, with the time spent setting up the
+    animations, interpolating, rasterizing and writing frames nested inside it
+    frame by frame, and the mobjects and points it animated in its arguments.
+    The file opens in chrome://tracing, Perfetto and speedscope.
+    """
+
+    profile_trace_dir = None
+
+    def setup(self):
+        super().setup()
+        self.profile_trace_dir = self.profile_trace_dir or os.environ.get("MANIM_PROFILE_TRACE")
+        self.trace_events = []
+        self._profiled_call = None
+        if not self.profile_trace_dir:
+            return
+        self._trace_start = time.perf_counter()
+        self._phase_event = None
+        for name, part in PROFILED_PARTS.items():
+            owner = self if hasattr(Scene, name) else self.renderer
+            setattr(owner, name, self._profiled_part(getattr(owner, name), part))
+
+    def play(self, *args, **kwargs):
+        self._profile_call("play", sys._getframe(1), super().play, *args, **kwargs)
+
+    def wait(self, *args, **kwargs):
+        self._profile_call("wait", sys._getframe(1), super().wait, *args, **kwargs)
+
+    def begin_phase(self, name, **inputs):
+        if self.profile_trace_dir:
+            self._end_phase_event()
+            self._phase_event = {"name": name, "ph": "X", "pid": 1, "tid": 0, "ts": self._trace_time(), "args": {"inputs": repr(inputs)}}
+        super().begin_phase(name, **inputs)
+
+    def tear_down(self):
+        super().tear_down()
+        if self.profile_trace_dir:
+            self._end_phase_event()
+            self.write_trace()
+
+    def trace_file(self):
+        phase = getattr(self, "render_phase", None)
+        name = type(self).__name__ if phase is None else phase_output_name(type(self).__name__, phase)
+        return Path(self.profile_trace_dir) / f"{name}.trace.json"
+
+    def write_trace(self):
+        thread_names = {0: "phases", 1: "play and wait"}
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": thread_name}}
+            for tid, thread_name in thread_names.items()
+        ]
+        trace_file = self.trace_file()
+        trace_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(trace_file, "w") as file:
+            json.dump({"traceEvents": metadata + self.trace_events, "displayTimeUnit": "ms"}, file)
+
+        calls = sorted((event for event in self.trace_events if event.get("cat") in ("play", "wait")), key=lambda event: -event["dur"])
+        summary = "".join(f"\n  {event['dur'] / 1e6:8.2f}s  {event['name']}" for event in calls[:5])
+        logger.info(f"Wrote profile of {type(self).__name__} to {trace_file}, slowest calls:{summary}")
+
+    def _trace_time(self):
+        return (time.perf_counter() - self._trace_start) * 1e6
+
+    def _end_phase_event(self):
+        if self._phase_event is not None:
+            self._phase_event["dur"] = self._trace_time() - self._phase_event["ts"]
+            self.trace_events.append(self._phase_event)
+            self._phase_event = None
+
+    def _profile_call(self, kind, caller, call, *args, **kwargs):
+        # wait goes through play, and only the outermost call is recorded
+        if not self.profile_trace_dir or self._profiled_call is not None:
+            call(*args, **kwargs)
+            return
+        filename, line = caller.f_code.co_filename, caller.f_lineno
+        source = linecache.getline(filename, line).strip() or kind
+        self._profiled_call = dict.fromkeys(set(PROFILED_PARTS.values()), 0.0)
+        start = self._trace_time()
+        try:
+            call(*args, **kwargs)
+        finally:
+            parts, self._profiled_call = self._profiled_call, None
+            end = self._trace_time()
+            mobjects = [mob for animation in self.animations or [] for mob in animation.mobject.get_family()]
+            self.trace_events.append({
+                "name": f"{source}  ({Path(filename).name}:{line})",
+                "cat": kind,
+                "ph": "X",
+                "pid": 1,
+                "tid": 1,
+                "ts": start,
+                "dur": end - start,
+                "args": {
+                    "location": f"{filename}:{line}",
+                    "animations": [str(animation) for animation in self.animations or []],
+                    "mobjects": len(mobjects),
+                    "points": int(sum(len(mob.points) for mob in mobjects)),
+                    "moving_mobjects": len(self.moving_mobjects or []),
+                    "run_time": self.duration,
+                    "skipped": self.renderer.skip_animations,
+                    **{f"{part}_seconds": seconds for part, seconds in parts.items()},
+                },
+            })
+
+    def _profiled_part(self, function, part):
+        def wrapper(*args, **kwargs):
+            if self._profiled_call is None:
+                return function(*args, **kwargs)
+            start = self._trace_time()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                duration = self._trace_time() - start
+                self._profiled_call[part] += duration / 1e6
+                self.trace_events.append({"name": part, "cat": "part", "ph": "X", "pid": 1, "tid": 1, "ts": start, "dur": duration})
+        return wrapper
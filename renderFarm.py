@@ -0,0 +1,165 @@
+import argparse
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import re
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import sympy as sp
+from manim import *
+
+from functionEvaluator import evaluator
+from lessonData import x_range_defaults
+from phaseRender import QUALITIES
+
+SCENE_MODULES = {"TrapRule": "trapezoidalRule", "SimpsonRule": "SimpsonRule"}
+# Job keys each scene takes over as class attributes
+SCENE_PARAMETERS = {
+    "TrapRule": ("f_expr", "x_range", "y_range", "delta_xs", "sweep_delta_xs"),
+    "SimpsonRule": ("f_expr", "x_range", "y_range", "examples", "ns"),
+}
+JOB_KEYS = {"id", "scenes", "quality"}.union(*SCENE_PARAMETERS.values())
+
+
+def fit_y_range(func, x_range, ticks=4):
+    """Axes y_range covering func over x_range and zero, with a 1, 2 or 5 step and about ticks steps."""
+    samples = func(np.linspace(*x_range, 256))
+    low, high = min(0.0, float(samples.min())), max(0.0, float(samples.max()))
+    raw_step = (high - low) / ticks or 1.0
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(factor * magnitude for factor in (1, 2, 5, 10) if factor * magnitude >= raw_step)
+    y_min = math.floor(low / step) * step
+    return (y_min, max(math.ceil(high / step) * step, y_min + step), step)
+
+
+def job_scene_class(scene_name, job):
+    """Subclass of the scene that teaches the job's function, ranges, delta_x values or n values."""
+    unknown = set(job) - JOB_KEYS
+    if unknown:
+        raise ValueError(f"Unknown job keys {', '.join(sorted(unknown))}")
+    scene_class = getattr(importlib.import_module(SCENE_MODULES[scene_name]), scene_name)
+    attributes = {key: job[key] for key in SCENE_PARAMETERS[scene_name] if key in job}
+    if "f_expr" in attributes:
+        attributes["f_expr"] = sp.sympify(attributes["f_expr"])
+    for key in ("x_range", "y_range", "delta_xs", "sweep_delta_xs", "ns"):
+        if key in attributes:
+            attributes[key] = tuple(attributes[key])
+    if "examples" in attributes:
+        attributes["examples"] = tuple(tuple(points) for points in attributes["examples"])
+    if "x_range" in attributes:
+        defaults = x_range_defaults(attributes["x_range"])
+        for key in SCENE_PARAMETERS[scene_name]:
+            if key in defaults and key not in attributes:
+                attributes[key] = defaults[key]
+    check_job_ranges(scene_name, {key: attributes.get(key, getattr(scene_class, key)) for key in SCENE_PARAMETERS[scene_name]})
+    # The lesson's axes only fit the lesson's function, so other functions get axes fitted to them
+    if "y_range" not in attributes and ("f_expr" in attributes or "x_range" in attributes):
+        f_expr = attributes.get("f_expr", scene_class.f_expr)
+        attributes["y_range"] = fit_y_range(evaluator.compile(f_expr), attributes.get("x_range", scene_class.x_range))
+    # A name of its own keeps the partial movies of concurrent jobs apart
+    return type(job_output_name(scene_name, job), (scene_class,), attributes)
+
+
+def check_job_ranges(scene_name, parameters):
+    """Raises ValueError for sweep widths or example points that do not fit in x_range."""
+    a, b = parameters["x_range"]
+    for delta_x in parameters.get("sweep_delta_xs", ()):
+        if not 0 < delta_x <= b - a:
+            raise ValueError(f"{scene_name} sweep width {delta_x} does not fit in x_range [{a}, {b}]")
+    for points in parameters.get("examples", ()):
+        if not all(a <= point <= b for point in points):
+            raise ValueError(f"{scene_name} example points {list(points)} lie outside x_range [{a}, {b}]")
+
+
+def job_output_name(scene_name, job):
+    return f"{scene_name}_{re.sub(r'[^0-9A-Za-z]+', '_', str(job['id'])).strip('_')}"
+
+
+def _init_worker():
+    # Import Manim, sympy and the scenes once per worker instead of once per video
+    for module_name in SCENE_MODULES.values():
+        importlib.import_module(module_name)
+
+
+def render_job(scene_name, job, quality):
+    """Renders one scene of one job and returns a report of how it went instead of raising."""
+    report = {"id": job["id"], "scene": scene_name, "pid": os.getpid()}
+    start = time.perf_counter()
+    try:
+        scene_class = job_scene_class(scene_name, job)
+        with tempconfig({
+            "quality": QUALITIES.get(job.get("quality"), job.get("quality", quality)),
+            "input_file": importlib.import_module(SCENE_MODULES[scene_name]).__file__,
+            "output_file": scene_class.__name__,
+            "preview": False,
+        }):
+            scene = scene_class()
+            scene.render()
+            report.update(status="ok", movie=str(scene.renderer.file_writer.movie_file_path))
+    except Exception:
+        report.update(status="failed", error=traceback.format_exc())
+    report["seconds"] = time.perf_counter() - start
+    return report
+
+
+def read_jobs(path):
+    jobs = []
+    with open(path) as file:
+        for line_number, line in enumerate(file, start=1):
+            if line.strip():
+                job = json.loads(line)
+                job.setdefault("id", f"job{line_number}")
+                jobs.append(job)
+    return jobs
+
+
+def run_farm(jobs, quality="low_quality", workers=None, report_file=None):
+    """Renders every scene of every job on a pool of warm workers and returns the reports in completion order."""
+    tasks = [(scene_name, job) for job in jobs for scene_name in job.get("scenes", SCENE_MODULES)]
+    reports = []
+    # Spawned workers start from a clean Manim config, then stay alive for every job they are handed
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers or os.cpu_count(), mp_context=context, initializer=_init_worker) as pool:
+        futures = {pool.submit(render_job, scene_name, job, quality): (scene_name, job) for scene_name, job in tasks}
+        for done, future in enumerate(as_completed(futures), start=1):
+            scene_name, job = futures[future]
+            try:
+                report = future.result()
+            except Exception as error:
+                # A worker that dies takes its job down without a report of its own
+                report = {"id": job["id"], "scene": scene_name, "status": "failed", "error": f"{type(error).__name__}: {error}"}
+            reports.append(report)
+            if report["status"] == "ok":
+                logger.info(f"[{done}/{len(tasks)}] {report['id']} {scene_name} rendered in {report['seconds']:.1f}s: {report['movie']}")
+            else:
+                logger.error(f"[{done}/{len(tasks)}] {report['id']} {scene_name} failed:\n{report['error']}")
+            if report_file is not None:
+                report_file.write(json.dumps(report) + "\n")
+                report_file.flush()
+    return reports
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render TrapRule and SimpsonRule for every job of a JSONL job list on warm worker processes.")
+    parser.add_argument("jobs", help='JSONL file with one job per line, e.g. {"id": "cubic", "f_expr": "x**3", "x_range": [0, 2], '
+                        '"delta_xs": [2, 1], "sweep_delta_xs": [0.5, 0.25], "ns": [4, 8]}')
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--report", help="JSONL file to append one report per rendered scene to")
+    args = parser.parse_args()
+
+    report_file = open(args.report, "a") if args.report else None
+    try:
+        reports = run_farm(read_jobs(args.jobs), QUALITIES[args.quality], args.workers, report_file)
+    finally:
+        if report_file is not None:
+            report_file.close()
+    failed = [report for report in reports if report["status"] != "ok"]
+    logger.info(f"Rendered {len(reports) - len(failed)} of {len(reports)} scenes")
+    sys.exit(1 if failed else 0)
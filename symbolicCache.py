@@ -0,0 +1,171 @@
+import ast
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import sympy as sp
+
+
+# The only constructors an srepr passes a string to, as a name or as decimal digits.
+# Subclasses are left out on purpose: an applied Function('f') sympifies a string argument.
+STRING_ARGUMENT_CLASSES = (sp.Symbol, sp.Dummy, sp.Function, sp.Float)
+
+
+def _from_srepr(text):
+    """Rebuilds an expression from its srepr, refusing anything else an entry could have been replaced with.
+
+    The expression is built one constructor call at a time instead of being
+    handed to sympify, and every argument but those strings is sympified
+    strictly, so no string in an entry is ever parsed as code.
+    """
+    return _build_srepr_node(ast.parse(text, mode="eval").body)
+
+
+def _build_srepr_node(node):
+    if isinstance(node, ast.Call):
+        cls = _build_srepr_node(node.func)
+        if not (isinstance(cls, type) and issubclass(cls, sp.Basic)):
+            raise ValueError(f"Unexpected call of {cls!r} in a cached expression")
+        args = []
+        for index, arg in enumerate(node.args):
+            if index == 0 and cls in STRING_ARGUMENT_CLASSES and isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                args.append(arg.value)
+            else:
+                args.append(sp.sympify(_build_srepr_node(arg), strict=True))
+        kwargs = {}
+        for keyword in node.keywords:
+            # Assumptions, precision and dummy_index are all plain numbers or booleans
+            if keyword.arg is None or not isinstance(keyword.value, ast.Constant) or isinstance(keyword.value.value, str):
+                raise ValueError("Unexpected keyword argument in a cached expression")
+            kwargs[keyword.arg] = keyword.value.value
+        try:
+            return cls(*args, **kwargs)
+        except Exception as error:
+            # Whatever a constructor raises for arguments it does not take, the entry is a miss
+            raise ValueError(f"Cannot rebuild {cls.__name__} in a cached expression: {error}") from error
+    if isinstance(node, ast.Name):
+        value = getattr(sp, node.id, None)
+        if not (isinstance(value, sp.Basic) or isinstance(value, type) and issubclass(value, sp.Basic)):
+            raise ValueError(f"Unexpected name {node.id!r} in a cached expression")
+        return value
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _build_srepr_node(node.operand)
+        if not isinstance(value, (int, float)):
+            raise ValueError("Unexpected negation in a cached expression")
+        return -value
+    if isinstance(node, (ast.Tuple, ast.List)):
+        return tuple(_build_srepr_node(element) for element in node.elts)
+    raise ValueError(f"Unexpected {type(node).__name__} in a cached expression")
+
+
+class SymbolicCache:
+    """On-disk cache of the sympy work done for an expression, shared by every process.
+
+    Each artifact (polynomial coefficients, LaTeX, antiderivative, definite
+    integral) is one JSON file named after a hash of its kind, the sympy
+    version and the srepr of its inputs, so equal expressions share entries
+    however they were built. Entries are never modified: a worker
+    writes a temporary file next to the entry and renames it into place, so
+    concurrent workers never read a partial entry and at worst both compute
+    the same value.
+
+    Float coefficients are read as the decimals they print as before
+    integrating, so integrals of the lesson functions come out exact.
+
+    Entries are only ever read as data: expressions are rebuilt from their
+    srepr one constructor at a time and never evaluated, and NumPy functions are
+    generated by lambdify in each process rather than loaded as source. An
+    entry that does not parse counts as a miss and is written again.
+    """
+
+    def __init__(self, directory=None):
+        self._directory = Path(directory).resolve() if directory else None
+        self._memory = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory(self):
+        # Resolved on first use, once the scene or CLI has set Manim's media_dir
+        if self._directory is None:
+            directory = os.environ.get("MANIM_SYMBOLIC_CACHE") or self._media_dir() / "symbolic_cache"
+            self._directory = Path(directory).resolve()
+        return self._directory
+
+    @staticmethod
+    def _media_dir():
+        # The dry run never imports Manim, and then uses Manim's default media_dir
+        manim = sys.modules.get("manim")
+        return Path(manim.config.media_dir if manim is not None else "media")
+
+    def lambdify(self, f_expr, symbol):
+        # Generated code is never read back from the shared directory, where anyone could have written it
+        return sp.lambdify(symbol, f_expr, modules="numpy")
+
+    def polynomial_coefficients(self, f_expr, symbol):
+        """Coefficients from the highest power down, or None when f_expr is not a polynomial in symbol."""
+        def compute():
+            if not sp.sympify(f_expr).is_polynomial(symbol):
+                return None
+            return [float(c) for c in sp.Poly(f_expr, symbol).all_coeffs()]
+        return self._cached("coefficients", (f_expr, symbol), compute)
+
+    def latex(self, f_expr):
+        return self._cached("latex", (f_expr,), lambda: sp.latex(f_expr))
+
+    def antiderivative(self, f_expr, symbol):
+        return self._cached_expr("antiderivative", (f_expr, symbol), lambda: sp.integrate(self._exact(f_expr), symbol))
+
+    def definite_integral(self, f_expr, symbol, a, b):
+        return self._cached_expr(
+            "definite_integral", (f_expr, symbol, sp.sympify(a), sp.sympify(b)),
+            lambda: sp.integrate(self._exact(f_expr), (symbol, a, b)),
+        )
+
+    @staticmethod
+    def _exact(f_expr):
+        return sp.nsimplify(f_expr, rational=True)
+
+    def _cached_expr(self, kind, inputs, compute):
+        # Expressions are stored as their srepr, which sympify reads back exactly
+        return self._cached(kind, inputs, lambda: sp.srepr(compute()), load=_from_srepr)
+
+    def _cached(self, kind, inputs, compute, load=None):
+        key_data = [kind, sp.__version__, *(sp.srepr(sp.sympify(value)) for value in inputs)]
+        key = hashlib.sha256(json.dumps(key_data).encode("utf-8")).hexdigest()[:32]
+        if key in self._memory:
+            return self._memory[key]
+        path = self.directory / f"{kind}-{key}.json"
+        try:
+            with open(path) as file:
+                value = json.load(file)["value"]
+            result = value if load is None else load(value)
+            self.hits += 1
+        except (FileNotFoundError, KeyError, TypeError, ValueError, SyntaxError):
+            # Missing, or left corrupt or replaced by something other than this cache
+            self.misses += 1
+            value = compute()
+            self._write(path, {"key": key_data, "value": value})
+            result = value if load is None else load(value)
+        self._memory[key] = result
+        return result
+
+    def _write(self, path, entry):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, prefix=path.stem, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w") as file:
+                json.dump(entry, file)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+# Shared cache so every scene and evaluator in a process reads the same entries
+symbolic_cache = SymbolicCache()
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from adaptivePlot import adaptive_samples
+
+
+def graph_of(func):
+    def sample(t_values):
+        return np.stack([t_values, func(t_values), np.zeros_like(t_values)], axis=1)
+    return sample
+
+
+def chord_errors(points, sample, t_values):
+    t_mid = (t_values[:-1] + t_values[1:]) / 2
+    return np.linalg.norm(sample(t_mid) - (points[:-1] + points[1:]) / 2, axis=1)
+
+
+def test_straight_lines_keep_the_initial_samples():
+    t_values, points = adaptive_samples(graph_of(lambda t: 3 * t - 2), 0, 10, 1.0, 100, initial_samples=8)
+    np.testing.assert_allclose(t_values, np.linspace(0, 10, 9))
+    assert points.shape == (9, 3)
+
+
+def test_curves_are_refined_to_the_tolerance():
+    sample = graph_of(np.sin)
+    t_values, points = adaptive_samples(sample, 0, 2 * np.pi, 0.5, 100)
+    assert np.all(np.diff(t_values) > 0)
+    np.testing.assert_allclose(points, sample(t_values))
+    assert np.all(chord_errors(points, sample, t_values) * 100 <= 0.5)
+
+
+def test_samples_gather_where_the_curve_bends():
+    # exp bends hardest at its right end, where the slope is largest on screen
+    t_values, _ = adaptive_samples(graph_of(lambda t: np.exp(3 * t)), 0, 1, 0.5, 100)
+    left, right = np.sum(t_values < 0.5), np.sum(t_values >= 0.5)
+    assert right > 2 * left
+
+
+def test_tighter_tolerance_adds_samples():
+    sample = graph_of(np.sin)
+    coarse, _ = adaptive_samples(sample, 0, 2 * np.pi, 2.0, 100)
+    fine, _ = adaptive_samples(sample, 0, 2 * np.pi, 0.1, 100)
+    assert len(fine) > len(coarse)
+
+
+def test_depth_limit():
+    t_values, _ = adaptive_samples(graph_of(np.sin), 0, 2 * np.pi, 1e-12, 100, initial_samples=4, max_depth=3)
+    assert len(t_values) <= 4 * 2 ** 3 + 1
@@ -0,0 +1,43 @@
+import numpy as np
+
+from formulaBuilder import DEFAULT_TERM_BUDGET, elide_terms, join_terms, simpson_substitution_tex
+
+
+def test_short_sums_are_kept():
+    terms = ["a", "b", "c"]
+    assert elide_terms(terms, 3) == terms
+    assert elide_terms(iter(terms)) == terms
+
+
+def test_long_sums_keep_both_ends():
+    terms = [f"t_{i}" for i in range(10)]
+    assert elide_terms(terms, 6) == ["t_0", "t_1", "t_2", r"\cdots", "t_7", "t_8", "t_9"]
+    # An odd budget keeps the extra term at the start
+    assert elide_terms(terms, 5) == ["t_0", "t_1", "t_2", r"\cdots", "t_8", "t_9"]
+    assert elide_terms(terms, 1) == ["t_0", r"\cdots"]
+
+
+def test_elided_length_is_flat_in_n():
+    for n in (7, 50, 1000):
+        assert len(elide_terms(range(n))) == DEFAULT_TERM_BUDGET + 1
+
+
+def test_join_terms_elides_each_group_and_skips_empty_ones():
+    assert join_terms(["a"], [], ["b", "c"]) == "a + b + c"
+    assert join_terms(["f"], [str(i) for i in range(8)], budget=2) == r"f + 0 + \cdots + 7"
+
+
+def test_simpson_substitution_tex():
+    x_values = np.linspace(0, 4, 5)
+    general, (substituted, bracketed, total) = simpson_substitution_tex(x_values, x_values ** 2)
+    assert "4f(1.00) + 4f(3.00)" in general
+    assert "4(1.00) + 4(9.00)" in substituted
+    assert bracketed == r"= \frac{1.00}{3} \left[ 0.00 + 40.00 + 8.00 + 16.00 \right]"
+    assert total == "= 21.33"
+
+
+def test_simpson_substitution_is_elided_past_the_budget():
+    x_values = np.linspace(0, 10, 101)
+    general, (substituted, _, _) = simpson_substitution_tex(x_values, np.sin(x_values), budget=4)
+    assert general.count(r"\cdots") == 2
+    assert substituted.count(r"\cdots") == 2
@@ -0,0 +1,51 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+av = pytest.importorskip("av")
+pytest.importorskip("manim")
+
+from manim._config.video_encoder import VideoEncoderSpec
+
+from frameDedup import HeldFrameEncoder
+from phaseRender import concat_movies
+
+SPEC = VideoEncoderSpec("mp4", "libx264", "yuv420p", 64, 48, Fraction(15), (("crf", "23"),))
+
+
+def solid_frame(value):
+    frame = np.zeros((SPEC.height, SPEC.width, 4), dtype=np.uint8)
+    frame[..., :3] = value
+    frame[..., 3] = 255
+    return frame
+
+
+def write_segment(target, runs):
+    encoder = HeldFrameEncoder(target=target, spec=SPEC)
+    for value, frames, repeat in runs:
+        # The renderer sends the very same array again for a frame it did not rasterize
+        pixels = solid_frame(value)
+        for _ in range(frames):
+            encoder.write_frame(pixels, repeat=repeat)
+    encoder.finish()
+    return target
+
+
+def test_concatenated_held_segments_keep_their_timeline(tmp_path):
+    segments = [
+        write_segment(tmp_path / "0.mp4", [(10, 1, 1), (60, 1, 20)]),
+        write_segment(tmp_path / "1.mp4", [(110, 12, 1)]),
+        write_segment(tmp_path / "2.mp4", [(160, 3, 1), (210, 1, 5), (250, 4, 1)]),
+    ]
+    frame_counts = [21, 12, 12]
+    movie = concat_movies(segments, tmp_path / "movie.mp4")
+
+    with av.open(str(movie)) as container:
+        stream = container.streams.video[0]
+        times = [frame.time for frame in container.decode(stream)]
+        duration = float(stream.duration * stream.time_base)
+    assert len(times) == sum(frame_counts)
+    assert all(later > earlier for earlier, later in zip(times, times[1:]))
+    np.testing.assert_allclose(np.diff(times), 1 / 15, atol=1e-3)
+    assert duration == pytest.approx(sum(frame_counts) / 15, abs=1.5 / 15)
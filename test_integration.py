@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from integration import (
+    composite_simpson,
+    composite_simpson_batch,
+    composite_trapezoid,
+    composite_trapezoid_batch,
+    percent_error,
+    reference_integral,
+    richardson_extrapolate,
+    romberg_table,
+    simpson_sum,
+    simpson_terms,
+    trapezoid_sum,
+)
+
+
+def cubic(x):
+    return 0.05 * x**3 - 0.55 * x**2 + x + 7
+
+
+def test_trapezoid_sum_by_hand():
+    # h = 0.5: 0.25 * (0 + 1 + 2 * 0.25)
+    assert trapezoid_sum([0, 0.25, 1], 0, 1) == pytest.approx(0.375)
+
+
+def test_trapezoid_is_exact_for_lines():
+    assert composite_trapezoid(lambda x: 3 * x - 5, 0, 10, 1) == pytest.approx(100)
+
+
+def test_trapezoid_lesson_values():
+    assert composite_trapezoid(cubic, 0, 10, 1) == pytest.approx(95)
+    assert composite_trapezoid(cubic, 0, 10, 2) == pytest.approx(70)
+
+
+def test_simpson_terms():
+    assert simpson_terms([1, 2, 3, 4, 5]) == (1, 4 * (2 + 4), 2 * 3, 5)
+
+
+def test_simpson_is_exact_for_cubics():
+    assert composite_simpson(cubic, 0, 10, 2) == pytest.approx(185 / 3)
+    assert simpson_sum(cubic(np.linspace(0, 10, 9)), 0, 10) == pytest.approx(185 / 3)
+
+
+def test_simpson_needs_even_intervals():
+    with pytest.raises(ValueError):
+        composite_simpson(np.exp, 0, 1, 3)
+    with pytest.raises(ValueError):
+        composite_simpson_batch(np.exp, 0, 1, [2, 5])
+
+
+def test_batches_match_one_n_at_a_time():
+    ns = [2, 4, 6, 10, 64]
+    np.testing.assert_allclose(composite_trapezoid_batch(np.sin, 0, 3, ns), [composite_trapezoid(np.sin, 0, 3, n) for n in ns])
+    np.testing.assert_allclose(composite_simpson_batch(np.sin, 0, 3, ns), [composite_simpson(np.sin, 0, 3, n) for n in ns])
+
+
+def test_reference_integral():
+    assert reference_integral(cubic, 0, 10) == pytest.approx(185 / 3, rel=1e-14)
+    assert reference_integral(np.exp, 0, 2) == pytest.approx(np.exp(2) - 1, rel=1e-14)
+
+
+def test_richardson_cancels_the_trapezoid_error():
+    coarse, fine = composite_trapezoid(cubic, 0, 10, 2), composite_trapezoid(cubic, 0, 10, 4)
+    assert richardson_extrapolate(coarse, fine) == pytest.approx(185 / 3)
+
+
+def test_romberg_table():
+    table = romberg_table(np.exp, 0, 1, 5)
+    assert np.isnan(table[0, 1])
+    np.testing.assert_allclose(table[:, 0], [composite_trapezoid(np.exp, 0, 1, 2**k) for k in range(5)])
+    assert table[4, 4] == pytest.approx(np.e - 1, rel=1e-12)
+    # Each column converges faster than the one before it
+    errors = np.abs(np.diag(table) - (np.e - 1))
+    assert np.all(np.diff(errors) < 0)
+
+
+def test_percent_error():
+    assert percent_error(95, 185 / 3) == pytest.approx(54.054054, rel=1e-6)
+    np.testing.assert_allclose(percent_error([110, 90], 100), [10, -10])
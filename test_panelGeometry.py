@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from panelGeometry import parabola_bezier_points, parabola_coefficients, trapezoid_corners
+
+
+class AffineAxes:
+    """Stands in for Axes with a skewed, shifted affine coordinate map."""
+
+    def c2p(self, x, y):
+        return np.array([2 * x + 0.5 * y + 1, 3 * y - 1, 0.0])
+
+
+def bezier(control_points, t):
+    t = np.asarray(t)[:, np.newaxis]
+    p0, p1, p2, p3 = control_points
+    return (1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t ** 2 * p2 + t ** 3 * p3
+
+
+def parabola_through(x_values, y_values):
+    return np.poly1d(np.polyfit(x_values, y_values, 2))
+
+
+def lesson_function(x):
+    return 0.05 * x**3 - 0.55 * x**2 + x + 7
+
+
+@pytest.mark.parametrize("x_start, x_end, delta_x", [(0, 10, 10), (0, 10, 5), (0, 10, 1), (0, 10, 0.5), (1.5, 4, 0.5)])
+def test_trapezoid_corners_sit_on_the_graph(x_start, x_end, delta_x):
+    axes = AffineAxes()
+    corners = trapezoid_corners(axes, lesson_function, x_start, x_end, delta_x)
+    x_left = np.arange(x_start, x_end, delta_x, dtype=float)
+    assert corners.shape == (len(x_left), 4, 3)
+    for panel, x in enumerate(x_left):
+        x_right = x + delta_x
+        expected = [axes.c2p(x, 0), axes.c2p(x, lesson_function(x)), axes.c2p(x_right, lesson_function(x_right)), axes.c2p(x_right, 0)]
+        np.testing.assert_allclose(corners[panel], expected, atol=1e-12)
+
+
+X_VALUES = np.array([0.0, 1.0, 2.0, 4.0, 6.0])
+Y_VALUES = np.array([1.0, 3.0, 2.0, -1.0, 5.0])
+
+
+def test_coefficients_interpolate_every_panel():
+    a, b, c = parabola_coefficients(X_VALUES, Y_VALUES)
+    for panel in range(2):
+        x = X_VALUES[2 * panel:2 * panel + 3]
+        values = a[panel] * (x - x[1]) ** 2 + b[panel] * (x - x[1]) + c[panel]
+        np.testing.assert_allclose(values, Y_VALUES[2 * panel:2 * panel + 3])
+
+
+@pytest.mark.parametrize("overhang", [0, 0.5])
+def test_curves_lie_on_the_parabolas(overhang):
+    axes = AffineAxes()
+    points = parabola_bezier_points(axes, X_VALUES, Y_VALUES, overhang)
+    assert points.shape == (8, 3)
+    t = np.linspace(0, 1, 11)
+    for panel in range(2):
+        x = X_VALUES[2 * panel:2 * panel + 3]
+        parabola = parabola_through(x, Y_VALUES[2 * panel:2 * panel + 3])
+        # The curve is parametrized linearly in x, so sample t maps to this x
+        x_on_curve = x[0] - overhang + t * (x[-1] - x[0] + 2 * overhang)
+        expected = np.array([axes.c2p(x_value, parabola(x_value)) for x_value in x_on_curve])
+        np.testing.assert_allclose(bezier(points[4 * panel:4 * panel + 4], t), expected, atol=1e-9)
@@ -0,0 +1,124 @@
+import importlib
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+import sympy as sp
+
+pytest.importorskip("manim")
+pytest.importorskip("av")
+
+from manim import config, tempconfig
+
+from phaseRender import code_fingerprint, phase_key, render_phases_in_parallel
+
+x = sp.Symbol('x')
+SCENE_SOURCE = '''
+from manim import *
+
+from phaseRender import PhasedSceneMixin
+
+
+class ThreePhases(PhasedSceneMixin, Scene):
+    phases = ("square", "circle", "both")
+
+    def construct(self):
+        self.begin_phase("square")
+        square = Square()
+        self.play(Create(square))
+        self.begin_phase("circle")
+        circle = Circle().shift(RIGHT * 2)
+        self.play(square.animate.shift(LEFT * 2), FadeIn(circle))
+        self.wait(0.5)
+        self.begin_phase("both")
+        self.play(Rotate(square, PI / 4), circle.animate.scale(0.5))
+'''
+INPUTS = {"f_expr": sp.exp(x / 2) - x**3 + 100 * x, "axes": {"x_range": [0, 11, 1], "y_range": [0, 450, 50]}, "ns": (4, 8)}
+
+
+def test_key_is_a_stable_hash():
+    key = phase_key("SimpsonRule", "n = 8", INPUTS)
+    assert len(key) == 32 and int(key, 16) >= 0
+    assert phase_key("SimpsonRule", "n = 8", dict(INPUTS)) == key
+
+
+def test_equal_inputs_share_a_key():
+    reordered = {"ns": [4, 8], "axes": {"y_range": (0, 450, 50), "x_range": np.array([0, 11, 1])}, "f_expr": 100 * x - x**3 + sp.exp(x / 2)}
+    assert phase_key("SimpsonRule", "n = 8", reordered) == phase_key("SimpsonRule", "n = 8", INPUTS)
+
+
+@pytest.mark.parametrize("scene, phase, inputs", [
+    ("TrapRule", "n = 8", INPUTS),
+    ("SimpsonRule", "n = 4", INPUTS),
+    ("SimpsonRule", "n = 8", {**INPUTS, "ns": (4, 8, 16)}),
+    ("SimpsonRule", "n = 8", {**INPUTS, "f_expr": x**2}),
+])
+def test_any_change_changes_the_key(scene, phase, inputs):
+    assert phase_key(scene, phase, inputs) != phase_key("SimpsonRule", "n = 8", INPUTS)
+
+
+def test_output_format_is_part_of_the_key():
+    key = phase_key("SimpsonRule", "n = 8", INPUTS)
+    with tempconfig({"frame_rate": config.frame_rate + 1}):
+        assert phase_key("SimpsonRule", "n = 8", INPUTS) != key
+
+
+def test_code_is_part_of_the_key():
+    assert phase_key("SimpsonRule", "n = 8", INPUTS, "a" * 64) != phase_key("SimpsonRule", "n = 8", INPUTS, "b" * 64)
+
+
+def test_fingerprint_follows_the_helpers_a_scene_imports(tmp_path, monkeypatch):
+    (tmp_path / "fingerprint_lesson.py").write_text("import numpy as np\nfrom fingerprint_panels import *\n\n\nclass Lesson:\n    pass\n")
+    (tmp_path / "fingerprint_panels.py").write_text("from fingerprint_formulas import budget\n")
+    (tmp_path / "fingerprint_formulas.py").write_text("budget = 6\n")
+    (tmp_path / "fingerprint_unrelated.py").write_text("budget = 6\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    scene_class = importlib.import_module("fingerprint_lesson").Lesson
+    fingerprint = code_fingerprint(scene_class)
+
+    (tmp_path / "fingerprint_unrelated.py").write_text("budget = 8\n")
+    assert code_fingerprint(scene_class) == fingerprint
+    # A module imported only through another one still counts
+    (tmp_path / "fingerprint_formulas.py").write_text("budget = 8\n")
+    assert code_fingerprint(scene_class) != fingerprint
+
+
+def test_key_is_the_same_in_every_process():
+    code = (
+        "import sympy as sp; from phaseRender import phase_key; x = sp.Symbol('x'); "
+        "print(phase_key('SimpsonRule', 'n = 8', {'f_expr': sp.exp(x / 2) - x**3 + 100 * x, "
+        "'axes': {'x_range': [0, 11, 1], 'y_range': [0, 450, 50]}, 'ns': (4, 8)}))"
+    )
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert keys == {phase_key("SimpsonRule", "n = 8", INPUTS)}
+
+
+def decoded_frames(movie_file):
+    with av.open(str(movie_file)) as container:
+        return [frame.to_ndarray(format="rgb24") for frame in container.decode(video=0)]
+
+
+def test_phases_rendered_in_parallel_match_a_serial_render(tmp_path, monkeypatch):
+    # Spawned workers start in the same directory, so they import the scene and write media there too
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "three_phases.py").write_text(SCENE_SOURCE)
+    scene_class = importlib.import_module("three_phases").ThreePhases
+    with tempconfig({"quality": "low_quality", "input_file": str(tmp_path / "three_phases.py"), "output_file": "serial", "preview": False}):
+        scene = scene_class()
+        scene.render()
+        serial_movie = scene.renderer.file_writer.movie_file_path
+
+    parallel_movie = render_phases_in_parallel("three_phases", "ThreePhases", "low_quality", workers=3, use_cache=False)
+    serial_frames, parallel_frames = decoded_frames(serial_movie), decoded_frames(parallel_movie)
+    assert len(parallel_frames) == len(serial_frames) > 0
+    for serial_frame, parallel_frame in zip(serial_frames, parallel_frames):
+        np.testing.assert_array_equal(parallel_frame, serial_frame)
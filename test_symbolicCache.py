@@ -0,0 +1,50 @@
+import json
+
+import pytest
+import sympy as sp
+
+from symbolicCache import SymbolicCache, _from_srepr
+
+x = sp.Symbol("x")
+LESSON_FUNCTION = 0.05 * x**3 - 0.55 * x**2 + x + 7
+
+
+@pytest.mark.parametrize("expr", [
+    LESSON_FUNCTION,
+    sp.integrate(sp.nsimplify(LESSON_FUNCTION, rational=True), x),
+    sp.Rational(-3, 7) * sp.sin(x) + sp.exp(-x) * sp.pi,
+    sp.Symbol("t", positive=True) ** sp.Float("2.5", 30),
+    sp.Function("f")(x) + sp.Integral(sp.log(x), (x, 1, sp.oo)),
+])
+def test_srepr_round_trip(expr):
+    assert _from_srepr(sp.srepr(expr)) == expr
+
+
+def payloads(marker):
+    code = f"__import__('pathlib').Path({str(marker)!r}).touch()"
+    return [
+        f"{code}",
+        f"sin({code!r})",
+        f"Add(Symbol('x'), {code!r})",
+        f"Function('f')({code!r})",
+        f"Function('f')(Symbol('x'))({code!r})",
+        f"Symbol('x', real={code!r})",
+        f"Integer(Symbol({code!r}).__class__)",
+    ]
+
+
+def test_replaced_entries_are_never_evaluated(tmp_path):
+    marker = tmp_path / "evaluated"
+    cache = SymbolicCache(tmp_path / "cache")
+    antiderivative = cache.antiderivative(LESSON_FUNCTION, x)
+    (entry,) = (tmp_path / "cache").glob("antiderivative-*.json")
+
+    for payload in payloads(marker):
+        data = json.loads(entry.read_text())
+        data["value"] = payload
+        entry.write_text(json.dumps(data))
+        # A fresh cache, so the entry is read from disk and not from memory
+        cache = SymbolicCache(tmp_path / "cache")
+        assert cache.antiderivative(LESSON_FUNCTION, x) == antiderivative
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert not marker.exists(), payload
@@ -0,0 +1,297 @@
+import json
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import *
+import manim.mobject.text.tex_mobject as tex_mobject
+from manim.utils import tex_file_writing
+from manim.utils.exceptions import EndSceneEarlyException
+
+# Compile directories older than this were left behind by a process that died
+STALE_INTERMEDIATE_SECONDS = 60 * 60
+# A lock older than this belongs to a compile that died, and is broken
+LOCK_TIMEOUT_SECONDS = 5 * 60
+# SVGs used this recently may be between their lookup and their parse in another process
+EVICTION_GRACE_SECONDS = 10 * 60
+# Stands in for the glyphs of a tex string that is not compiled yet
+PLACEHOLDER_GLYPH = "<path d='M0 0h1v1h-1z'/>"
+
+# The cache of a precompile worker process
+_worker_cache = None
+
+
+def _init_compile_worker(directory):
+    global _worker_cache
+    _worker_cache = TexCache(directory)
+
+
+def _compile_tex(expression, environment, cache=None):
+    try:
+        (cache or _worker_cache).compile(expression, environment)
+    except Exception as error:
+        return f"{expression!r}: {error}"
+    return None
+
+
+class TexCache:
+    """Content-addressed on-disk cache of compiled MathTex SVGs, shared by every scene.
+
+    Manim names each SVG after a hash of the complete .tex source, so the key
+    already covers the tex string, the environment and the template preamble.
+    Font size is applied by scaling the imported SVG and never changes the file.
+    Recently used SVGs are kept and the oldest are evicted past max_bytes.
+
+    Any number of processes share the directory. A string is compiled by the
+    one process holding its .lock file, in a directory of that process's own,
+    and the finished SVG is renamed into the cache, so no process ever sees a
+    partial .dvi or .svg of another.
+    """
+
+    def __init__(self, directory=None, max_bytes=512 * 1024 ** 2):
+        directory = directory or os.environ.get("MANIM_TEX_CACHE") or Path(config.media_dir) / "tex_cache"
+        self.directory = Path(directory).resolve()
+        self.work_directory = self.directory / "work"
+        self.max_bytes = max_bytes
+        # Set while recording, to answer misses with placeholders instead of compiling them
+        self.placeholder_directory = None
+        self.requested = []
+        self._requested_keys = set()
+        self.hits = 0
+        self.misses = 0
+
+    def install(self):
+        self.work_directory.mkdir(parents=True, exist_ok=True)
+        tex_mobject.tex_to_svg_file = self.tex_to_svg_file
+        return self
+
+    def svg_path(self, expression, environment=None, tex_template=None):
+        tex_template = tex_template or config["tex_template"]
+        if environment is not None:
+            tex_code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+        else:
+            tex_code = tex_template.get_texcode_for_expression(expression)
+        return self.directory / (tex_file_writing.tex_hash(tex_code) + ".svg")
+
+    def tex_to_svg_file(self, expression, environment=None, tex_template=None):
+        svg_file = self.svg_path(expression, environment, tex_template)
+        try:
+            # The modification time doubles as the last use for LRU eviction
+            os.utime(svg_file)
+            self.hits += 1
+        except FileNotFoundError:
+            self.misses += 1
+            if self.placeholder_directory is not None:
+                svg_file = self._placeholder_svg(expression, svg_file)
+            else:
+                self.compile(expression, environment, tex_template)
+        if (expression, environment) not in self._requested_keys:
+            self._requested_keys.add((expression, environment))
+            self.requested.append([expression, environment])
+        return svg_file
+
+    def compile(self, expression, environment=None, tex_template=None):
+        """Compiles one tex string unless it is cached, waiting for any other process compiling it."""
+        svg_file = self.svg_path(expression, environment, tex_template)
+        lock_file = svg_file.with_suffix(".lock")
+        while not self._claim(lock_file):
+            if svg_file.exists():
+                return svg_file
+            time.sleep(0.05)
+        try:
+            # The process that held the lock before may have finished it
+            if svg_file.exists():
+                return svg_file
+            self.work_directory.mkdir(parents=True, exist_ok=True)
+            work_directory = tempfile.mkdtemp(prefix=f"{os.getpid()}-", dir=self.work_directory)
+            tex_dir = config.tex_dir
+            try:
+                config.tex_dir = work_directory
+                compiled = tex_file_writing.tex_to_svg_file(expression, environment, tex_template)
+                os.replace(compiled, svg_file)
+            finally:
+                config.tex_dir = tex_dir
+                shutil.rmtree(work_directory, ignore_errors=True)
+        finally:
+            self._remove(lock_file)
+        return svg_file
+
+    def _placeholder_svg(self, expression, svg_file):
+        # One glyph per group MathTex marks in the expression, so the mobject splits into its parts as usual
+        groups = "".join(
+            tag if tag == "</g>" else tag + PLACEHOLDER_GLYPH
+            for tag in re.findall(r"\\special\{dvisvgm:raw (<g id='[^']*'>|</g>)\}", expression)
+        )
+        placeholder = self.placeholder_directory / svg_file.name
+        placeholder.write_text(
+            f"<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 1 1'>{PLACEHOLDER_GLYPH}{groups}</svg>", encoding="utf-8"
+        )
+        return placeholder
+
+    @staticmethod
+    def _claim(lock_file):
+        try:
+            os.close(os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            pass
+        try:
+            if time.time() - lock_file.stat().st_mtime > LOCK_TIMEOUT_SECONDS:
+                TexCache._remove(lock_file)
+        except FileNotFoundError:
+            pass
+        return False
+
+    def missing(self, tex_items):
+        """The (expression, environment) pairs of tex_items that are not cached yet, each once."""
+        misses = []
+        for expression, environment in tex_items:
+            if (expression, environment) not in misses and not self.svg_path(expression, environment).exists():
+                misses.append((expression, environment))
+        return misses
+
+    def precompile(self, tex_items, max_workers=None):
+        """Compiles every (expression, environment) pair that is not cached yet in a process pool."""
+        misses = self.missing(tex_items)
+        if not misses:
+            return 0
+
+        logger.info(f"Precompiling {len(misses)} tex strings into {self.directory}")
+        if multiprocessing.parent_process() is not None:
+            # Phase and farm workers already fill every core, so each compiles its own strings in turn
+            errors = [_compile_tex(expression, environment, self) for expression, environment in misses]
+        else:
+            with ProcessPoolExecutor(max_workers, initializer=_init_compile_worker, initargs=(str(self.directory),)) as pool:
+                errors = list(pool.map(_compile_tex, *zip(*misses)))
+        for error in errors:
+            # The scene compiles the failed string again and reports the full LaTeX error
+            if error is not None:
+                logger.warning(f"Precompiling failed for {error}")
+        return len(misses)
+
+    def manifest_path(self, scene_name):
+        return self.directory / "manifests" / f"{scene_name}.json"
+
+    def load_manifest(self, scene_name):
+        try:
+            return json.loads(self.manifest_path(scene_name).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return []
+
+    def save_manifest(self, scene_name):
+        # Partial renders only see some of the strings, so keep the ones recorded before
+        tex_items = self.requested + [item for item in self.load_manifest(scene_name) if item not in self.requested]
+        path = self.manifest_path(scene_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(tex_items), encoding="utf-8")
+        os.replace(temporary, path)
+
+    def evict(self):
+        now = time.time()
+        svg_files = []
+        # SVGs in their grace period count towards max_bytes but are never removed
+        total_bytes = 0
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            age = now - stat.st_mtime
+            if entry.name.endswith(".svg"):
+                total_bytes += stat.st_size
+                if age > EVICTION_GRACE_SECONDS:
+                    svg_files.append((stat.st_mtime, stat.st_size, entry.path))
+            elif entry.name.endswith(".lock"):
+                if age > LOCK_TIMEOUT_SECONDS:
+                    self._remove(entry.path)
+            elif age > STALE_INTERMEDIATE_SECONDS:
+                self._remove(entry.path)
+        if self.work_directory.is_dir():
+            for entry in os.scandir(self.work_directory):
+                try:
+                    if now - entry.stat().st_mtime > STALE_INTERMEDIATE_SECONDS:
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                except FileNotFoundError:
+                    pass
+
+        for _, size, path in sorted(svg_files):
+            if total_bytes <= self.max_bytes:
+                break
+            self._remove(path)
+            total_bytes -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Another render process evicted it first
+            pass
+
+
+class TexCacheMixin:
+    """Scene mixin that routes every MathTex through the shared TexCache.
+
+    The tex strings an earlier render of the scene asked for are kept in its
+    manifest. When every one of them is cached the manifest is trusted, and a
+    string this render asks for that is not in it compiles on demand. When the
+    manifest is missing or has misses, construct first runs once with every
+    animation skipped and nothing drawn while placeholder SVGs stand in for
+    LaTeX, which lists the tex strings this render will ask for. The missing
+    ones are compiled in parallel, so construct only reads the cache.
+    """
+
+    tex_cache_dir = None
+    tex_cache_max_bytes = 512 * 1024 ** 2
+    precompile_tex = True
+
+    def setup(self):
+        super().setup()
+        self.tex_cache = TexCache(self.tex_cache_dir, self.tex_cache_max_bytes).install()
+        if self.precompile_tex:
+            tex_items = self.tex_cache.load_manifest(type(self).__name__)
+            # Recording costs about as much as construct itself, so it only runs when the manifest falls short
+            if not tex_items or self.tex_cache.missing(tex_items):
+                tex_items += self.record_tex()
+            self.tex_cache.precompile(tex_items)
+
+    def record_tex(self):
+        """Runs construct without drawing or compiling anything and returns the tex strings it asked for."""
+        # The recording must not record a recording of its own
+        recording = type(type(self).__name__, (type(self),), {"precompile_tex": False})(skip_animations=True)
+        with tempfile.TemporaryDirectory() as placeholder_directory:
+            try:
+                recording.setup()
+                recording.tex_cache.placeholder_directory = Path(placeholder_directory)
+                renderer = recording.renderer
+                play = renderer.play
+
+                def skipped_play(*args, **kwargs):
+                    # Phases turn skipping off where they start, but the recording never draws
+                    renderer._original_skipping_status = True
+                    play(*args, **kwargs)
+
+                renderer.play = skipped_play
+                renderer.update_frame = lambda *args, **kwargs: None
+                recording.construct()
+            except EndSceneEarlyException:
+                pass
+            except Exception as error:
+                # construct itself raises it again with the real tex, and compiles what was not recorded
+                logger.warning(f"Recording the tex strings of {type(self).__name__} stopped early: {error}")
+            finally:
+                self.tex_cache.install()
+        return recording.tex_cache.requested
+
+    def tear_down(self):
+        self.tex_cache.save_manifest(type(self).__name__)
+        self.tex_cache.evict()
+        super().tear_down()
@@ -1,18 +1,57 @@
 from manim import *
+import numpy as np
+import sympy as sp
+from adaptivePlot import plot_adaptive
+from frameDedup import FrameDedupMixin
+from functionEvaluator import evaluator
+from lessonData import TRAP_RULE_LESSON, trap_rule_results
+from mobjectPool import MobjectPool
+from panelGeometry import TrapezoidSweep, trapezoid_points
+from phaseRender import PhasedSceneMixin
+from profiling import ProfilingMixin
+from symbolicCache import symbolic_cache
+from texCache import TexCacheMixin
+
+class TrapRule(FrameDedupMixin, ProfilingMixin, PhasedSceneMixin, TexCacheMixin, Scene):
+    # The lesson taught by the scene, which the render farm replaces per job
+    f_expr = TRAP_RULE_LESSON["f_expr"]
+    x_range = TRAP_RULE_LESSON["x_range"]
+    y_range = (0, 20, 5)
+    # Widths worked through step by step, then the narrower widths of the closing sweep
+    delta_xs = TRAP_RULE_LESSON["delta_xs"]
+    sweep_delta_xs = (2, 1, 0.5)
+    # Shrink delta_x smoothly over sweep_delta_x_range instead of showing the sweep widths one by one
+    continuous_sweep = False
+    sweep_delta_x_range = (10, 0.01)
+
+    @classmethod
+    def lesson_phases(cls):
+        return ("integral", *(f"delta_x = {delta_x:g}" for delta_x in cls.delta_xs), "delta_x sweep")
 
-class TrapRule(Scene):
     def construct(self):
-        def func(x):
-            return 0.05 * x**3 - 0.55 * x**2 + x + 7
-
-        axes = Axes(
-            x_range=[0, 10, 1], 
-            y_range=[0, 20, 5], 
+        f_expr = self.f_expr
+        func = evaluator.compile(f_expr)
+        a, b = self.x_range
+        # The same numbers dryRun.py reports
+        results = trap_rule_results(f_expr, self.x_range, self.delta_xs)
+
+        axes_config = dict(
+            x_range=[a, b, (b - a) / 10],
+            y_range=list(self.y_range),
             axis_config={"color": BLUE}
         )
+        axes = Axes(**axes_config)
+
+        graph = plot_adaptive(axes, func, color=RED)
+
+        # The trapezoids and measure line that every delta_x phase fills again are reshaped instead of rebuilt
+        pool = MobjectPool()
 
-        graph = axes.plot(func, color=RED)
+        def format_value(value):
+            # 7, 12 and 4.5 rather than 7.00, 12.00 and 4.50
+            return f"{value:.2f}".rstrip("0").rstrip(".")
 
+        self.begin_phase("integral", f_expr=f_expr, axes=axes_config)
         title = MathTex("Trapezoidal \\ Rule", font_size=64, color=WHITE).to_edge(UP)
         self.play(Write(title))
         self.play(title.animate.to_edge(UP))
@@ -21,266 +60,251 @@ class TrapRule(Scene):
         self.play(Create(axes))
         self.play(Create(graph))
 
-        # Show the function and step-by-step integration
-        func_text = MathTex("f(x) = 0.05x^3 - 0.55x^2 + x + 7", font_size=36, color=WHITE).to_edge(UP)
+        # Show the function and step-by-step integration, worked out symbolically once per expression
+        x = evaluator.symbol
+        f_latex = symbolic_cache.latex(f_expr)
+        antiderivative = symbolic_cache.antiderivative(f_expr, x)
+        exact_integral = symbolic_cache.definite_integral(f_expr, x, a, b)
+
+        func_text = MathTex(f"f(x) = {f_latex}", font_size=36, color=WHITE).to_edge(UP)
         self.play(Write(func_text))
-        area_text = MathTex(r"\text{Area under the curve} = \int_{0}^{10} (0.05x^3 - 0.55x^2 + x + 7) \,dx", font_size=36, color=WHITE).next_to(func_text, DOWN)
+        area_text = MathTex(rf"\text{{Area under the curve}} = \int_{{{a}}}^{{{b}}} \left({f_latex}\right) \,dx", font_size=36, color=WHITE).next_to(func_text, DOWN)
         self.play(Write(area_text))
 
         integral_func_text = MathTex(
-            r"= \left[\frac{0.05}{4}x^4 - \frac{0.55}{3}x^3 + \frac{1}{2}x^2 + 7x \right]_0^{10}", font_size=36, color=WHITE
+            rf"= \left[{symbolic_cache.latex(antiderivative)} \right]_{{{a}}}^{{{b}}}", font_size=36, color=WHITE
         ).next_to(area_text, DOWN)
         self.play(Write(integral_func_text))
 
+        # Substituting a symbol named "(10)" prints the upper limit in place of x
+        upper_latex = symbolic_cache.latex(antiderivative.subs(x, sp.Symbol(f"({b})")))
+        lower_latex = symbolic_cache.latex(antiderivative.subs(x, a))
         integral_value_text = MathTex(
-            r"= \left[\frac{0.05}{4}(10)^4 - \frac{0.55}{3}(10)^3 + \frac{1}{2}(10)^2 + 7(10) \right] - \left[0 \right]", font_size=36, color=WHITE
+            rf"= \left[{upper_latex} \right] - \left[{lower_latex} \right]", font_size=36, color=WHITE
         ).next_to(integral_func_text, DOWN)
         self.play(Write(integral_value_text))
 
-        integral_value = (0.05/4 * 10**4 - 0.55/3 * 10**3 + 0.5 * 10**2 + 7 * 10) - (0.05/4 * 0**4 - 0.55/3 * 0**3 + 0.5 * 0**2 + 7 * 0)
-        final_value_text = MathTex(f"= {integral_value:.2f}", font_size=36, color=WHITE).next_to(integral_value_text, DOWN)
+        integral_value = results["integral_value"]
+        final_value_text = MathTex(
+            rf"= {symbolic_cache.latex(exact_integral)} \approx {integral_value:.2f}", font_size=36, color=WHITE
+        ).next_to(integral_value_text, DOWN)
         self.play(Write(final_value_text))
         self.wait()
         self.play(*[FadeOut(mob) for mob in self.mobjects if mob != axes and mob != graph and mob != final_value_text])
-        self.play(final_value_text.animate.move_to(axes.c2p(5, 2)))
-
+        y_low, y_high = self.y_range[:2]
+        self.play(final_value_text.animate.move_to(axes.c2p((a + b) / 2, y_low + (y_high - y_low) / 10)))
 
         # Show the Trapezoidal rule formula
         formula = MathTex(
             r"\frac{\Delta x}{2} \left[ y_1 + y_n + 2(y_2 + y_3 + \ldots + y_{n-1}) \right]", font_size=24
-        ).to_edge(UP)
-        self.play(Write(formula))
-        self.wait()
+        )
 
         def create_trapezoids(delta_x):
-            trapezoids = VGroup()
-            x_values = np.arange(0, 10, delta_x)
-            for x in x_values:
-                x_next = x + delta_x
-                trapezoid = Polygon(
-                    axes.c2p(x, 0), axes.c2p(x, func(x)),
-                    axes.c2p(x_next, func(x_next)), axes.c2p(x_next, 0),
-                    fill_color=BLUE, fill_opacity=0.5, stroke_color=WHITE
+            # All trapezoids are the subpaths of a single VMobject, which every delta_x reuses
+            return pool.points("trapezoids", trapezoid_points(axes, func, a, b, delta_x), fill_color=BLUE, fill_opacity=0.5, stroke_color=WHITE)
+
+        # Sample dots and labels stay on screen through every worked delta_x once shown, renumbered as the nodes change
+        sample_labels = {}
+        label_numbers = {}
+
+        for index, delta_x in enumerate(self.delta_xs):
+            self.begin_phase(f"delta_x = {delta_x:g}", f_expr=f_expr, axes=axes_config, delta_xs=self.delta_xs[:index + 1])
+            if index == 0:
+                self.play(Write(formula.to_edge(UP)))
+                self.wait()
+
+            measure_line = pool.line("measure_line", axes.c2p(a, 0), axes.c2p(a + delta_x, 0), color=PURPLE).shift(DOWN * 0.5)
+            delta_x_label = MathTex(f"\\Delta x = {delta_x:g}", font_size=36, color=WHITE).next_to(measure_line, DOWN * 0.2)
+            self.play(Create(measure_line), Write(delta_x_label))
+            self.wait()
+
+            # Trapezoid visualization for this Δx
+            trapezoids = create_trapezoids(delta_x)
+            self.play(Create(trapezoids), run_time=4)
+            self.wait()
+
+            # The endpoints come first in the formula, followed by the doubled interior samples
+            nodes = np.linspace(a, b, int(round((b - a) / delta_x)) + 1)
+            samples = [nodes[0], nodes[-1], *nodes[1:-1]]
+            sample_values = {x_node: func(x_node) for x_node in samples}
+            # Samples are numbered by their position among this delta_x's nodes, as in the formula
+            node_numbers = {x_node: number for number, x_node in enumerate(nodes, start=1)}
+
+            def sample_label(x_node, dot):
+                label = MathTex(f"y_{{{node_numbers[x_node]}}} = ", format_value(sample_values[x_node]), font_size=20, color=WHITE)
+                label_numbers[x_node] = node_numbers[x_node]
+                return label.next_to(dot, UP + RIGHT if x_node == a else UP)
+
+            # Renumber the samples already on the graph and remove those that are not nodes any more
+            stale = [x_node for x_node in sample_labels if x_node not in node_numbers]
+            renumbered = [x_node for x_node in sample_labels if x_node in node_numbers and label_numbers[x_node] != node_numbers[x_node]]
+            if stale or renumbered:
+                self.play(
+                    *[FadeOut(*sample_labels.pop(x_node)) for x_node in stale],
+                    *[Transform(sample_labels[x_node][1], sample_label(x_node, sample_labels[x_node][0])) for x_node in renumbered],
                 )
-                trapezoids.add(trapezoid)
-            return trapezoids
-
-        measure_line = Line(axes.c2p(0, 0), axes.c2p(10, 0), color=PURPLE).shift(DOWN * 0.5)
-        delta_x_label = MathTex("\\Delta x = 10", font_size=36, color=WHITE).next_to(measure_line, DOWN*0.2)
-        self.play(Create(measure_line), Write(delta_x_label))
-        self.wait()
-
-        # Trapezoid visualization for Δx = 10
-        trapezoids_10 = create_trapezoids(10)
-        self.play(Create(trapezoids_10), run_time=4)
-        self.wait()
-
-        # Show y1 and y10 on the graph and their values
-        y1 = func(0)
-        y10 = func(10)
-        y1_dot = Dot(axes.c2p(0, y1), color=GREEN)
-        y10_dot = Dot(axes.c2p(10, y10), color=GREEN)
-        y1_label = MathTex(f"y_1 = {y1:.0f}", font_size=20, color=WHITE).next_to(y1_dot, UP+RIGHT)
-        y10_label = MathTex(r"y_{10} = ", f"{y10:.0f}", font_size=20, color=WHITE).next_to(y10_dot, UP)
-        self.play(FadeIn(y1_dot), FadeIn(y10_dot), Write(y1_label), Write(y10_label))
-        self.wait()
-
-        # Show Trapezoidal rule formula for Δx = 10 and animate the values
-        trap_formula_sub_10 = MathTex( r"\frac{10}{2} \left[ \,", r" y_1", r" +", r" y_{10}", r"\, \right]", font_size=20, color=WHITE ).next_to(formula, DOWN)
-        self.play(Write(trap_formula_sub_10))
-        self.wait()
-
-
-        # Create texts for the numerical parts
-        y1_value_text = MathTex(f"{y1:.0f}", font_size=15, color=WHITE)
-        y10_value_text = MathTex(f"{y10:.0f}", font_size=15, color=WHITE)
-
-        # Position the numerical parts at the initial positions
-        y1_value_text.move_to(y1_label.get_part_by_tex(f"{y1:.0f}").get_center())
-        y10_value_text.move_to(y10_label.get_part_by_tex(f"{y10:.0f}").get_center())
-
-        # Animate the numerical parts moving to the respective positions in the formula and Replace y_1 and y_{10} in the formula with the respective values
-        self.play(y1_value_text.animate.move_to(trap_formula_sub_10[1].get_center()))
-        self.play(Transform(trap_formula_sub_10.get_part_by_tex("y_1"), y1_value_text))
-
-        self.play(y10_value_text.animate.move_to(trap_formula_sub_10[3].get_center()))
-        self.play(Transform(trap_formula_sub_10.get_part_by_tex("y_{10}"), y10_value_text))
-
-        self.wait()
-
-        trap_area_10 = (y1 + y10) * 10 / 2
-        trap_area_10_Text = MathTex(f"= {trap_area_10:.2f}", font_size=20)
-        self.play(Write(trap_area_10_Text.next_to(trap_formula_sub_10, RIGHT)))
-        self.wait()
-
-        # Calculate the percent error
-        percent_error_10 = ((trap_area_10 - integral_value) / integral_value) * 100
-
-        # Percent error text
-        percent_error_text_10 = MathTex(
-            r"\text{Percent Error} = \left( \frac{\text{trap\_area\_10} - \text{integral\_value}}{\text{integral\_value}} \right) \times 100\%", font_size=16, color=WHITE
-        ).next_to(trap_formula_sub_10, DOWN)
-
-        # Percent error text with substituted values
-        percent_error_equation_10 = MathTex(
-            r"\text{Percent Error} = \left( \frac{" + f"{trap_area_10:.2f} - {integral_value:.2f}" + r"}{" + f"{integral_value:.2f}" + r"} \right) \times 100\%", font_size=16, color=WHITE
-        ).next_to(percent_error_text_10, DOWN)
-
-        # Percent error value
-        percent_error_value_10 = MathTex(
-            f"= {percent_error_10:.2f}\%", font_size=16, color=WHITE
-        ).next_to(percent_error_equation_10, DOWN)
-
-        # Animate the text
-        self.play(Write(percent_error_text_10))
-        self.wait()
-
-        self.play(Write(percent_error_equation_10))
-        self.wait()
-
-        self.play(Write(percent_error_value_10))
-        self.wait()
-
-
-        self.play(
-            Uncreate(trapezoids_10),
-            FadeOut(measure_line),
-            FadeOut(delta_x_label),
-            FadeOut(trap_formula_sub_10),
-            FadeOut(y1_value_text),
-            FadeOut(y10_value_text),
-            FadeOut(trap_area_10_Text),
-            FadeOut(percent_error_text_10),
-            FadeOut(percent_error_equation_10),
-            FadeOut(percent_error_value_10)
-        )
-        # Setting up Δx = 5 visualization
-        measure_line = Line(axes.c2p(0, 0), axes.c2p(5, 0), color=PURPLE).shift(DOWN * 0.5)
-        delta_x_label = MathTex("\\Delta x = 5", font_size=36, color=WHITE).next_to(measure_line, DOWN * 0.2)
-        self.play(Create(measure_line), Write(delta_x_label))
-        self.wait()
-
-        # Setting up Δx = 5 visualization
-        measure_line = Line(axes.c2p(0, 0), axes.c2p(5, 0), color=PURPLE).shift(DOWN * 0.5)
-        delta_x_label = MathTex("\\Delta x = 5", font_size=36, color=WHITE).next_to(measure_line, DOWN * 0.2)
-        self.play(Create(measure_line), Write(delta_x_label))
-        self.wait()
-
-        # Trapezoid visualization for Δx = 5
-        trapezoids_5 = create_trapezoids(5)
-        self.play(Create(trapezoids_5), run_time=4)
-        self.wait()
-
-        # Show y5 on the graph and its value
-        y5 = func(5)
-        y5_dot = Dot(axes.c2p(5, y5), color=GREEN)
-        y5_label = MathTex(f"y_5 = {y5:.1f}", font_size=20, color=WHITE).next_to(y5_dot, UP)
-        self.play(FadeIn(y5_dot), Write(y5_label))
-        self.wait()
-
-        # Show Trapezoidal rule formula for Δx = 5 and animate the values
-        trap_formula_sub_5 = MathTex( r"\frac{5}{2} \left[ \,", r"y_1", r"\,", r" +", r"\,", r"y_{10}", r"\,", r"+ 2(", r"y_5", r") \, \right]", font_size=20, color=WHITE ).next_to(formula, DOWN)
-        self.play(Write(trap_formula_sub_5))
-        self.wait()
-
-        # Create texts for the numerical parts
-        y5_value_text = MathTex(f"{y5:.1f}", font_size=15, color=WHITE)
-        y1_value_text.move_to(y1_label.get_part_by_tex(f"{y1:.0f}").get_center())
-        y10_value_text.move_to(y10_label.get_part_by_tex(f"{y10:.0f}").get_center())
-
-
-        # Position the numerical parts at the initial positions
-        y5_value_text.move_to(y5_label.get_part_by_tex(f"{y5:.1f}").get_center())
-
-        # Animate the numerical parts moving to the respective positions in the formula and Replace y_1, y_5, and y_{10} in the formula with the respective values
-        self.play(y1_value_text.animate.move_to(trap_formula_sub_5[1].get_center()))
-        self.play(Transform(trap_formula_sub_5.get_part_by_tex("y_1"), y1_value_text))
-
-        self.play(y10_value_text.animate.move_to(trap_formula_sub_5[5].get_center()))
-        self.play(Transform(trap_formula_sub_5.get_part_by_tex("y_{10}"), y10_value_text))
-
-        self.play(y5_value_text.animate.move_to(trap_formula_sub_5[8].get_center()))
-        self.play(Transform(trap_formula_sub_5.get_part_by_tex("y_5"), y5_value_text))
-
-        self.wait()
 
-        trap_area_5 = ((y1 + y10 + 2 * y5) * 5 / 2)
-        trap_area_5_Text = MathTex(f"= {trap_area_5:.2f}", font_size=20)
-        # Calculate the percent error
-        percent_error_5 = ((trap_area_5 - integral_value) / integral_value) * 100
-
-        # Percent error text
-        percent_error_text_5 = MathTex(
-            r"\text{Percent Error} = \left( \frac{\text{trap\_area\_5} - \text{integral\_value}}{\text{integral\_value}} \right) \times 100\%", font_size=16, color=WHITE
-        ).next_to(trap_formula_sub_5, DOWN)
-
-        # Percent error text with substituted values
-        percent_error_equation_5 = MathTex(
-            r"\text{Percent Error} = \left( \frac{" + f"{trap_area_5:.2f} - {integral_value:.2f}" + r"}{" + f"{integral_value:.2f}" + r"} \right) \times 100\%", font_size=16, color=WHITE
-        ).next_to(percent_error_text_5, DOWN)
-
-        # Percent error value
-        percent_error_value_5 = MathTex(
-            f"= {percent_error_5:.2f}\%", font_size=16, color=WHITE
-        ).next_to(percent_error_equation_5, DOWN)
-        self.play(Write(trap_area_5_Text.next_to(trap_formula_sub_5, RIGHT)))
-        self.wait()
-        self.play(Write(percent_error_text_5))
-        self.wait()
-
-        self.play(Write(percent_error_equation_5))
-        self.wait()
-
-        self.play(Write(percent_error_value_5))
-        self.wait()
-
-        self.play(
-            Uncreate(trapezoids_5),
-            FadeOut(measure_line),
-            FadeOut(delta_x_label),
-            FadeOut(trap_formula_sub_5),
-            FadeOut(y1_value_text),
-            FadeOut(y5_value_text),
-            FadeOut(y10_value_text),
-            FadeOut(trap_area_5_Text),
-            FadeOut(percent_error_text_5),
-            FadeOut(percent_error_equation_5),
-            FadeOut(percent_error_value_5)
-        )
+            # Show the samples not on the graph yet and their values
+            new_samples = [x_node for x_node in samples if x_node not in sample_labels]
+            for x_node in new_samples:
+                dot = Dot(axes.c2p(x_node, sample_values[x_node]), color=GREEN)
+                sample_labels[x_node] = (dot, sample_label(x_node, dot))
+            if new_samples:
+                self.play(*[FadeIn(sample_labels[x_node][0]) for x_node in new_samples], *[Write(sample_labels[x_node][1]) for x_node in new_samples])
+                self.wait()
+
+            # Show Trapezoidal rule formula for this Δx and animate the values
+            formula_parts = [rf"\frac{{{delta_x:g}}}{{2}} \left[ \,", "y_{1}", r"\, + \,", f"y_{{{len(nodes)}}}"]
+            sample_parts = [1, 3]
+            if len(nodes) > 2:
+                formula_parts.append(r"\, + 2(")
+                for number in range(2, len(nodes)):
+                    if len(formula_parts) > 5:
+                        formula_parts.append("+")
+                    sample_parts.append(len(formula_parts))
+                    formula_parts.append(f"y_{{{number}}}")
+                formula_parts.append(r") \, \right]")
+            else:
+                formula_parts.append(r"\, \right]")
+            trap_formula_sub = MathTex(*formula_parts, font_size=20, color=WHITE).next_to(formula, DOWN)
+            self.play(Write(trap_formula_sub))
+            self.wait()
+
+            # Move each value from its label into the formula and replace its y there
+            value_texts = []
+            for x_node, part in zip(samples, sample_parts):
+                value_text = MathTex(format_value(sample_values[x_node]), font_size=15, color=WHITE)
+                value_text.move_to(sample_labels[x_node][1][1].get_center())
+                self.play(value_text.animate.move_to(trap_formula_sub[part].get_center()))
+                self.play(Transform(trap_formula_sub[part], value_text))
+                value_texts.append(value_text)
+
+            self.wait()
+
+            trap_area = results[f"trap_area_{delta_x:g}"]
+            trap_area_text = MathTex(f"= {trap_area:.2f}", font_size=20)
+            self.play(Write(trap_area_text.next_to(trap_formula_sub, RIGHT)))
+            self.wait()
+
+            # Calculate the percent error
+            percent_error = results[f"percent_error_{delta_x:g}"]
+            if percent_error is None:
+                # The integral is zero, so the error is shown as a difference instead of a percentage
+                percent_error_text = MathTex(
+                    r"\text{Error} = \text{trap\_area\_" + f"{delta_x:g}" + r"} - \text{integral\_value}", font_size=16, color=WHITE
+                ).next_to(trap_formula_sub, DOWN)
+                percent_error_equation = MathTex(
+                    r"\text{Error} = " + f"{trap_area:.2f} - {integral_value:.2f}", font_size=16, color=WHITE
+                ).next_to(percent_error_text, DOWN)
+                percent_error_value = MathTex(
+                    f"= {results[f'absolute_error_{delta_x:g}']:.2f}", font_size=16, color=WHITE
+                ).next_to(percent_error_equation, DOWN)
+            else:
+                # Percent error text
+                percent_error_text = MathTex(
+                    r"\text{Percent Error} = \left( \frac{\text{trap\_area\_" + f"{delta_x:g}" + r"} - \text{integral\_value}}{\text{integral\_value}} \right) \times 100\%", font_size=16, color=WHITE
+                ).next_to(trap_formula_sub, DOWN)
+
+                # Percent error text with substituted values
+                percent_error_equation = MathTex(
+                    r"\text{Percent Error} = \left( \frac{" + f"{trap_area:.2f} - {integral_value:.2f}" + r"}{" + f"{integral_value:.2f}" + r"} \right) \times 100\%", font_size=16, color=WHITE
+                ).next_to(percent_error_text, DOWN)
+
+                # Percent error value
+                percent_error_value = MathTex(
+                    f"= {percent_error:.2f}\%", font_size=16, color=WHITE
+                ).next_to(percent_error_equation, DOWN)
+
+            # Animate the text
+            self.play(Write(percent_error_text))
+            self.wait()
+
+            self.play(Write(percent_error_equation))
+            self.wait()
+
+            self.play(Write(percent_error_value))
+            self.wait()
+
+            self.play(
+                Uncreate(trapezoids),
+                FadeOut(measure_line),
+                FadeOut(delta_x_label),
+                FadeOut(trap_formula_sub),
+                *[FadeOut(value_text) for value_text in value_texts],
+                FadeOut(trap_area_text),
+                FadeOut(percent_error_text),
+                FadeOut(percent_error_equation),
+                FadeOut(percent_error_value)
+            )
 
         self.play(*[FadeOut(mob) for mob in self.mobjects if mob != axes and mob != graph and mob != formula])
 
-        measure_line2 = Line(axes.c2p(0, 0), axes.c2p(2, 0), color=PURPLE).shift(DOWN * 0.5)
-        measure_line1 = Line(axes.c2p(0, 0), axes.c2p(1, 0), color=PURPLE).shift(DOWN * 0.5)
-        measure_line = Line(axes.c2p(0, 0), axes.c2p(0.5, 0), color=PURPLE).shift(DOWN * 0.5)
-
-
-        delta_x_label = MathTex("\\Delta x = 2", font_size=36, color=WHITE).next_to(measure_line2, DOWN*0.2)
-        self.play(Create(measure_line2), Write(delta_x_label))
-        self.wait()
-
-        # Trapezoid visualization for Δx = 2
-        trapezoids_2 = create_trapezoids(2)
-        self.play(Create(trapezoids_2),run_time=6)
-        self.wait()
-        self.play(Uncreate(trapezoids_2))
-
-        # Update measure line and label for Δx = 1
-        self.play(ReplacementTransform(measure_line2,measure_line1))
-        self.play(Transform(delta_x_label, MathTex("\\Delta x = 1", font_size=24, color=WHITE).next_to(measure_line1, DOWN*0.2)))
-
-        # Trapezoid visualization for Δx = 1
-        trapezoids_1 = create_trapezoids(1)
-        self.play(Create(trapezoids_1),run_time=8)
-        self.wait()
-        self.play(Uncreate(trapezoids_1))
+        sweep_delta_xs = self.sweep_delta_x_range if self.continuous_sweep else self.sweep_delta_xs
+        self.begin_phase("delta_x sweep", f_expr=f_expr, axes=axes_config, delta_xs=self.delta_xs, sweep_delta_xs=sweep_delta_xs, continuous=self.continuous_sweep)
+        if self.continuous_sweep:
+            self.sweep_delta_x(axes, func, a, b)
+            return
+
+        for index, delta_x in enumerate(self.sweep_delta_xs):
+            if index == 0:
+                measure_line = pool.line("measure_line", axes.c2p(a, 0), axes.c2p(a + delta_x, 0), color=PURPLE).shift(DOWN * 0.5)
+                delta_x_label = MathTex(f"\\Delta x = {delta_x:g}", font_size=36, color=WHITE).next_to(measure_line, DOWN*0.2)
+                self.play(Create(measure_line), Write(delta_x_label))
+                self.wait()
+            else:
+                self.play(Uncreate(trapezoids))
+
+                # Update measure line and label for this Δx, shrinking the label with the line
+                self.play(measure_line.animate.put_start_and_end_on(axes.c2p(a, 0) + DOWN * 0.5, axes.c2p(a + delta_x, 0) + DOWN * 0.5))
+                self.play(Transform(delta_x_label, MathTex(f"\\Delta x = {delta_x:g}", font_size=max(12, 36 - 12 * index), color=WHITE).next_to(measure_line, DOWN*0.2)))
+
+            # Trapezoid visualization for this Δx, slower as the panels multiply
+            trapezoids = create_trapezoids(delta_x)
+            self.play(Create(trapezoids), run_time=4 + 0.4 * np.ceil((b - a) / delta_x))
+            self.wait(4 if index == len(self.sweep_delta_xs) - 1 else 1)
+
+    def sweep_delta_x(self, axes, func, x_start, x_end, run_time=12):
+        """Shrinks delta_x over sweep_delta_x_range, rewriting one set of trapezoids in place every frame."""
+        start_delta_x, end_delta_x = self.sweep_delta_x_range
+        sweep = TrapezoidSweep(axes, func, x_start, x_end, end_delta_x, fill_color=BLUE, fill_opacity=0.5, stroke_color=WHITE)
+
+        # delta_x is tracked on a log scale, so every halving takes the same time
+        log_delta_x = ValueTracker(np.log10(start_delta_x))
+
+        def update_trapezoids(trapezoids):
+            delta_x = 10 ** log_delta_x.get_value()
+            sweep.update(delta_x)
+            # Thin the outlines as the panels narrow, or they cover the fill
+            trapezoids.set_stroke(width=DEFAULT_STROKE_WIDTH * min(1, delta_x))
+
+        def update_measure_line(line):
+            delta_x = 10 ** log_delta_x.get_value()
+            line.put_start_and_end_on(axes.c2p(x_start, 0) + DOWN * 0.5, axes.c2p(min(x_start + delta_x, x_end), 0) + DOWN * 0.5)
+
+        trapezoids = sweep.panels
+        update_trapezoids(trapezoids)
+        measure_line = Line(axes.c2p(x_start, 0), axes.c2p(x_start + start_delta_x, 0), color=PURPLE).shift(DOWN * 0.5)
+
+        # Live readouts of delta_x and of the trapezoidal estimate it gives
+        delta_x_value = DecimalNumber(start_delta_x, num_decimal_places=2, font_size=30)
+        area_value = DecimalNumber(sweep.area(), num_decimal_places=4, font_size=30)
+        readouts = VGroup(
+            VGroup(MathTex(r"\Delta x =", font_size=30), delta_x_value).arrange(RIGHT),
+            VGroup(MathTex(r"\text{Area} \approx", font_size=30), area_value).arrange(RIGHT),
+        ).arrange(DOWN, aligned_edge=LEFT).to_corner(UR)
+
+        self.play(FadeIn(trapezoids), Create(measure_line), Write(readouts))
+        # The trapezoids are added first, so the readouts see this frame's panels
+        trapezoids.add_updater(update_trapezoids)
+        measure_line.add_updater(update_measure_line)
+        delta_x_value.add_updater(lambda number: number.set_value(10 ** log_delta_x.get_value()))
+        area_value.add_updater(lambda number: number.set_value(sweep.area()))
+
+        self.play(log_delta_x.animate.set_value(np.log10(end_delta_x)), run_time=run_time, rate_func=linear)
+        self.wait(4)
 
-        # Update measure line and label for Δx = 0.5
-        self.play(ReplacementTransform(measure_line1,measure_line))
 
-        self.play(Transform(delta_x_label, MathTex("\\Delta x = 0.5", font_size=12, color=WHITE).next_to(measure_line, DOWN*0.2)))
+class TrapRuleSweep(TrapRule):
+    """TrapRule with the final delta_x sweep played as one continuous animation."""
 
-        # Trapezoid visualization for Δx = 0.5
-        trapezoids_0_5 = create_trapezoids(0.5)
-        self.play(Create(trapezoids_0_5),run_time=12)
-        self.wait(4)
+    continuous_sweep = True